@@ -1,6 +1,7 @@
 """Data models for presets, effects, and system settings."""
 
 from .preset import Preset
+from .bank import PresetBank
 from .effects import (
     FXModule,
     DistortionModule,
@@ -0,0 +1,161 @@
+"""Column-oriented storage for a bank of presets.
+
+A :class:`PresetBank` keeps every section of every preset in one
+contiguous ``bytearray`` per section (effect order, name, each module,
+tail) instead of one :class:`Preset` object graph per slot. Bulk scans
+such as "every amp's bass" become a single strided ``memoryview`` with
+no per-preset objects; :meth:`PresetBank.to_preset` materializes the
+dataclass API for a single slot when it is needed.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from .effects import MODULE_CLASSES
+from .file_formats import (
+    MBF_HEADER_SIZE,
+    MBF_PRESET_COUNT,
+    MBF_PRESET_ENTRY_SIZE,
+)
+from .preset import (
+    OFF_AMP,
+    OFF_CAB,
+    OFF_DELAY,
+    OFF_EFFECT_ORDER,
+    OFF_EQ,
+    OFF_FX,
+    OFF_MOD,
+    OFF_NAME,
+    OFF_NS,
+    OFF_OD,
+    OFF_REVERB,
+    OFF_SIZE,
+    OFF_TAIL,
+    PRESET_SIZE,
+    TAIL_SIZE,
+    Preset,
+)
+
+# (section, offset within a preset record, width) for every column.
+# The size field at OFF_SIZE is constant and is not stored.
+_SECTIONS: list[tuple[str, int, int]] = [
+    ("effect_order", OFF_EFFECT_ORDER, OFF_SIZE - OFF_EFFECT_ORDER),
+    ("name", OFF_NAME, 14),
+    ("fx", OFF_FX, MODULE_CLASSES["fx"].SIZE),
+    ("od", OFF_OD, MODULE_CLASSES["od"].SIZE),
+    ("amp", OFF_AMP, MODULE_CLASSES["amp"].SIZE),
+    ("cab", OFF_CAB, MODULE_CLASSES["cab"].SIZE),
+    ("ns", OFF_NS, MODULE_CLASSES["ns"].SIZE),
+    ("eq", OFF_EQ, MODULE_CLASSES["eq"].SIZE),
+    ("mod", OFF_MOD, MODULE_CLASSES["mod"].SIZE),
+    ("delay", OFF_DELAY, MODULE_CLASSES["delay"].SIZE),
+    ("reverb", OFF_REVERB, MODULE_CLASSES["reverb"].SIZE),
+    ("tail", OFF_TAIL, TAIL_SIZE),
+]
+
+# An empty record supplies the constant size field; every other byte
+# is overwritten from the columns.
+_RECORD_TEMPLATE = Preset().to_bytes()
+
+
+class PresetBank:
+    """Presets stored as one byte column per preset section."""
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.columns: dict[str, bytearray] = {
+            name: bytearray(count * width) for name, _, width in _SECTIONS
+        }
+
+    def __len__(self) -> int:
+        return self.count
+
+    @classmethod
+    def from_buffer(
+        cls,
+        data,
+        count: int,
+        offset: int = 0,
+        stride: int = PRESET_SIZE,
+    ) -> PresetBank:
+        """Load *count* preset records spaced *stride* bytes apart."""
+        bank = cls(count)
+        view = memoryview(data)
+        for name, section_offset, width in _SECTIONS:
+            column = bank.columns[name]
+            for i in range(count):
+                start = offset + i * stride + section_offset
+                column[i * width : (i + 1) * width] = view[start : start + width]
+        return bank
+
+    @classmethod
+    def from_mbf(cls, path: str | Path) -> PresetBank:
+        """Load every preset entry of a .mbf backup file."""
+        data = Path(path).read_bytes()
+        count = min(
+            MBF_PRESET_COUNT,
+            max(0, len(data) - MBF_HEADER_SIZE) // MBF_PRESET_ENTRY_SIZE,
+        )
+        return cls.from_buffer(
+            data, count, offset=MBF_HEADER_SIZE, stride=MBF_PRESET_ENTRY_SIZE
+        )
+
+    @classmethod
+    def from_presets(cls, presets: list[Preset]) -> PresetBank:
+        """Build a bank from already-parsed presets."""
+        buf = bytearray(len(presets) * PRESET_SIZE)
+        for i, preset in enumerate(presets):
+            preset.pack_into(buf, i * PRESET_SIZE)
+        return cls.from_buffer(buf, len(presets))
+
+    def record(self, index: int) -> bytes:
+        """Reassemble the 512-byte record for slot *index*."""
+        if not 0 <= index < self.count:
+            raise IndexError(f"Preset index {index} out of range")
+        buf = bytearray(_RECORD_TEMPLATE)
+        for name, section_offset, width in _SECTIONS:
+            start = index * width
+            buf[section_offset : section_offset + width] = (
+                self.columns[name][start : start + width]
+            )
+        return bytes(buf)
+
+    def to_preset(self, index: int) -> Preset:
+        """Materialize slot *index* as a :class:`Preset`."""
+        return Preset.from_bytes(self.record(index))
+
+    def name(self, index: int) -> str:
+        """Decode the name of slot *index* without building a Preset."""
+        if not 0 <= index < self.count:
+            raise IndexError(f"Preset index {index} out of range")
+        raw = self.columns["name"][index * 14 : (index + 1) * 14]
+        return raw.split(b"\x00", 1)[0].decode("ascii", errors="replace")
+
+    def param(self, module: str, param: str) -> memoryview:
+        """Strided view of one single-byte parameter across every slot.
+
+        ``bank.param("amp", "bass")[i]`` is slot *i*'s amp bass; writing
+        through the view edits the bank in place.
+
+        Raises:
+            ValueError: If the module or parameter is unknown, or the
+                parameter is wider than one byte.
+        """
+        if module not in MODULE_CLASSES:
+            raise ValueError(
+                f"Unknown module '{module}'. Valid: {list(MODULE_CLASSES)}"
+            )
+        cls = MODULE_CLASSES[module]
+        offsets = cls.param_offsets()
+        if param not in offsets:
+            raise ValueError(
+                f"Unknown parameter '{param}' for {module}. "
+                f"Valid: {list(offsets)}"
+            )
+        if cls.FIELD_WIDTHS.get(param, 1) != 1:
+            raise ValueError(
+                f"Parameter '{param}' spans several bytes; use to_preset()"
+            )
+        column = memoryview(self.columns[module])
+        return column[offsets[param] :: cls.SIZE]
@@ -6,15 +6,39 @@ values are unsigned 8-bit integers (0-255) unless noted otherwise.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, fields, asdict
-from typing import ClassVar
-
-
-@dataclass
+import struct
+from dataclasses import dataclass, fields
+from functools import cache
+from types import MappingProxyType
+from typing import ClassVar, Mapping
+
+# Precompiled layouts, one per module: field bytes followed by the
+# reserved tail. ``s`` pads short ``reserved`` values with NULs and
+# truncates long ones, matching the fixed module size.
+_FX_STRUCT = struct.Struct("<7B6s")
+_DIST_STRUCT = struct.Struct("<6B5s")
+_AMP_STRUCT = struct.Struct("<9B8s")
+_CAB_STRUCT = struct.Struct("<7B6s")
+_NS_STRUCT = struct.Struct("<6B5s")
+_EQ_STRUCT = struct.Struct("<3B6s6s8s")
+_MOD_STRUCT = struct.Struct("<8B7s")
+_DELAY_STRUCT = struct.Struct("<5BH3B7s")  # time_ms is a u16
+_REVERB_STRUCT = struct.Struct("<7B6s")
+
+# Shared zero-filled defaults. bytes are immutable, so every module can
+# reference the same object instead of building a fresh one per instance.
+_ZERO5 = bytes(5)
+_ZERO6 = bytes(6)
+_ZERO7 = bytes(7)
+_ZERO8 = bytes(8)
+
+
+@dataclass(slots=True)
 class EffectModule:
     """Base class for effect modules."""
 
     SIZE: ClassVar[int] = 0
+    _STRUCT: ClassVar[struct.Struct]
     # Byte width of each parameter within the serialized module.
     # Fields not listed occupy 1 byte.
     FIELD_WIDTHS: ClassVar[dict[str, int]] = {}
@@ -23,15 +47,50 @@ class EffectModule:
     type: int = 0
 
     def to_bytes(self) -> bytes:
+        try:
+            return self._STRUCT.pack(*self._pack_args())
+        except struct.error as exc:
+            raise ValueError(f"{type(self).__name__}: {exc}") from None
+
+    def pack_into(self, buf: bytearray, offset: int) -> None:
+        """Serialize the module straight into *buf* at *offset*."""
+        try:
+            self._STRUCT.pack_into(buf, offset, *self._pack_args())
+        except struct.error as exc:
+            raise ValueError(f"{type(self).__name__}: {exc}") from None
+
+    def _pack_args(self) -> tuple:
+        """Field values in ``_STRUCT`` order."""
         raise NotImplementedError
 
     @classmethod
     def from_bytes(cls, data: bytes):
-        raise NotImplementedError
+        if len(data) < cls.SIZE:
+            data = bytes(data).ljust(cls.SIZE, b"\x00")
+        return cls.unpack_from(data, 0)
+
+    @classmethod
+    def unpack_from(cls, buffer, offset: int = 0):
+        """Parse the module at *offset* in *buffer* without slicing it.
+
+        *buffer* may be any buffer (``bytes``, ``bytearray``,
+        ``memoryview``) holding at least ``offset + SIZE`` bytes.
+        """
+        return cls._from_values(cls._STRUCT.unpack_from(buffer, offset))
+
+    @classmethod
+    def _from_values(cls, values: tuple):
+        """Build a module from values unpacked in ``_STRUCT`` order."""
+        return cls(*values)
 
     @classmethod
-    def param_offsets(cls) -> dict[str, int]:
-        """Map each parameter name to its byte offset within the module."""
+    @cache
+    def param_offsets(cls) -> Mapping[str, int]:
+        """Map each parameter name to its byte offset within the module.
+
+        Computed once per class; the mapping is read-only because every
+        caller shares it.
+        """
         offsets: dict[str, int] = {}
         offset = 0
         for f in fields(cls):
@@ -39,217 +98,241 @@ class EffectModule:
                 continue
             offsets[f.name] = offset
             offset += cls.FIELD_WIDTHS.get(f.name, 1)
-        return offsets
+        return MappingProxyType(offsets)
 
     def to_dict(self) -> dict:
-        d = asdict(self)
-        # Raw bytes are not JSON-serializable and carry no user-facing info
-        d.pop("reserved", None)
-        d["enabled"] = bool(d["enabled"])
-        return d
+        # Hand-built rather than asdict(): no recursion or deep copies, and
+        # the raw reserved bytes (not JSON-serializable, no user-facing
+        # info) are simply never included.
+        return {
+            "header": self.header,
+            "enabled": bool(self.enabled),
+            "type": self.type,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class FXModule(EffectModule):
     """FX / Compressor module (13 bytes)."""
 
     SIZE: ClassVar[int] = 13
+    _STRUCT: ClassVar[struct.Struct] = _FX_STRUCT
     q: int = 0
     position: int = 0
     peak: int = 0
     level: int = 0
-    reserved: bytes = field(default_factory=lambda: b"\x00" * 6)
+    reserved: bytes = _ZERO6
 
-    def to_bytes(self) -> bytes:
-        return bytes([
+    def _pack_args(self) -> tuple:
+        return (
             self.header, self.enabled, self.type,
             self.q, self.position, self.peak, self.level,
-        ]) + self.reserved[:6]
-
-    @classmethod
-    def from_bytes(cls, data: bytes) -> FXModule:
-        if len(data) < cls.SIZE:
-            data = data + b"\x00" * (cls.SIZE - len(data))
-        return cls(
-            header=data[0], enabled=data[1], type=data[2],
-            q=data[3], position=data[4], peak=data[5], level=data[6],
-            reserved=data[7:13],
+            self.reserved,
         )
 
+    def to_dict(self) -> dict:
+        return {
+            **EffectModule.to_dict(self),
+            "q": self.q,
+            "position": self.position,
+            "peak": self.peak,
+            "level": self.level,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class DistortionModule(EffectModule):
     """Distortion / Overdrive module (11 bytes)."""
 
     SIZE: ClassVar[int] = 11
+    _STRUCT: ClassVar[struct.Struct] = _DIST_STRUCT
     volume: int = 0
     tone: int = 0
     gain: int = 0
-    reserved: bytes = field(default_factory=lambda: b"\x00" * 5)
+    reserved: bytes = _ZERO5
 
-    def to_bytes(self) -> bytes:
-        return bytes([
+    def _pack_args(self) -> tuple:
+        return (
             self.header, self.enabled, self.type,
             self.volume, self.tone, self.gain,
-        ]) + self.reserved[:5]
-
-    @classmethod
-    def from_bytes(cls, data: bytes) -> DistortionModule:
-        if len(data) < cls.SIZE:
-            data = data + b"\x00" * (cls.SIZE - len(data))
-        return cls(
-            header=data[0], enabled=data[1], type=data[2],
-            volume=data[3], tone=data[4], gain=data[5],
-            reserved=data[6:11],
+            self.reserved,
         )
 
+    def to_dict(self) -> dict:
+        return {
+            **EffectModule.to_dict(self),
+            "volume": self.volume,
+            "tone": self.tone,
+            "gain": self.gain,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class AmpModule(EffectModule):
     """Amp model module (17 bytes)."""
 
     SIZE: ClassVar[int] = 17
+    _STRUCT: ClassVar[struct.Struct] = _AMP_STRUCT
     amp_gain: int = 0
     bass: int = 0
     mid: int = 0
     treble: int = 0
     presence: int = 0
     master: int = 0
-    reserved: bytes = field(default_factory=lambda: b"\x00" * 8)
+    reserved: bytes = _ZERO8
 
-    def to_bytes(self) -> bytes:
-        return bytes([
+    def _pack_args(self) -> tuple:
+        return (
             self.header, self.enabled, self.type,
             self.amp_gain, self.bass, self.mid, self.treble,
             self.presence, self.master,
-        ]) + self.reserved[:8]
-
-    @classmethod
-    def from_bytes(cls, data: bytes) -> AmpModule:
-        if len(data) < cls.SIZE:
-            data = data + b"\x00" * (cls.SIZE - len(data))
-        return cls(
-            header=data[0], enabled=data[1], type=data[2],
-            amp_gain=data[3], bass=data[4], mid=data[5], treble=data[6],
-            presence=data[7], master=data[8],
-            reserved=data[9:17],
+            self.reserved,
         )
 
-
-@dataclass
+    def to_dict(self) -> dict:
+        return {
+            **EffectModule.to_dict(self),
+            "amp_gain": self.amp_gain,
+            "bass": self.bass,
+            "mid": self.mid,
+            "treble": self.treble,
+            "presence": self.presence,
+            "master": self.master,
+        }
+
+
+@dataclass(slots=True)
 class CabModule(EffectModule):
     """Cabinet simulation module (13 bytes)."""
 
     SIZE: ClassVar[int] = 13
+    _STRUCT: ClassVar[struct.Struct] = _CAB_STRUCT
     mic: int = 0
     center: int = 0
     distance: int = 0
     tube: int = 0
-    reserved: bytes = field(default_factory=lambda: b"\x00" * 6)
+    reserved: bytes = _ZERO6
 
-    def to_bytes(self) -> bytes:
-        return bytes([
+    def _pack_args(self) -> tuple:
+        return (
             self.header, self.enabled, self.type,
             self.mic, self.center, self.distance, self.tube,
-        ]) + self.reserved[:6]
-
-    @classmethod
-    def from_bytes(cls, data: bytes) -> CabModule:
-        if len(data) < cls.SIZE:
-            data = data + b"\x00" * (cls.SIZE - len(data))
-        return cls(
-            header=data[0], enabled=data[1], type=data[2],
-            mic=data[3], center=data[4], distance=data[5], tube=data[6],
-            reserved=data[7:13],
+            self.reserved,
         )
 
+    def to_dict(self) -> dict:
+        return {
+            **EffectModule.to_dict(self),
+            "mic": self.mic,
+            "center": self.center,
+            "distance": self.distance,
+            "tube": self.tube,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class NoiseGateModule(EffectModule):
     """Noise gate module (11 bytes)."""
 
     SIZE: ClassVar[int] = 11
+    _STRUCT: ClassVar[struct.Struct] = _NS_STRUCT
     attack: int = 0
     release: int = 0
     threshold: int = 0
-    reserved: bytes = field(default_factory=lambda: b"\x00" * 5)
+    reserved: bytes = _ZERO5
 
-    def to_bytes(self) -> bytes:
-        return bytes([
+    def _pack_args(self) -> tuple:
+        return (
             self.header, self.enabled, self.type,
             self.attack, self.release, self.threshold,
-        ]) + self.reserved[:5]
-
-    @classmethod
-    def from_bytes(cls, data: bytes) -> NoiseGateModule:
-        if len(data) < cls.SIZE:
-            data = data + b"\x00" * (cls.SIZE - len(data))
-        return cls(
-            header=data[0], enabled=data[1], type=data[2],
-            attack=data[3], release=data[4], threshold=data[5],
-            reserved=data[6:11],
+            self.reserved,
         )
 
+    def to_dict(self) -> dict:
+        return {
+            **EffectModule.to_dict(self),
+            "attack": self.attack,
+            "release": self.release,
+            "threshold": self.threshold,
+        }
 
-@dataclass
+
+_EQ_BAND_FIELDS = frozenset(("bands", "bands_extra"))
+
+
+@dataclass(slots=True)
 class EQModule(EffectModule):
     """Equalizer module (23 bytes)."""
 
     SIZE: ClassVar[int] = 23
+    _STRUCT: ClassVar[struct.Struct] = _EQ_STRUCT
     FIELD_WIDTHS: ClassVar[dict[str, int]] = {"bands": 6, "bands_extra": 6}
-    bands: list[int] = field(default_factory=lambda: [0] * 6)
-    bands_extra: list[int] = field(default_factory=lambda: [0] * 6)
-    reserved: bytes = field(default_factory=lambda: b"\x00" * 8)
-
-    def to_bytes(self) -> bytes:
-        return bytes([
+    # Band levels are kept as raw bytes so they pack without conversion.
+    # Lists are accepted wherever bands are assigned; use set_band() to
+    # edit one.
+    bands: bytes = _ZERO6
+    bands_extra: bytes = _ZERO6
+    reserved: bytes = _ZERO8
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in _EQ_BAND_FIELDS and not isinstance(
+            value, (bytes, bytearray)
+        ):
+            value = bytes(value)
+        object.__setattr__(self, name, value)
+
+    def set_band(self, index: int, value: int) -> None:
+        """Set band *index* (0-5) to *value*, editing the bands in place."""
+        if not isinstance(self.bands, bytearray):
+            self.bands = bytearray(self.bands)
+        self.bands[index] = value
+
+    def _pack_args(self) -> tuple:
+        return (
             self.header, self.enabled, self.type,
-        ] + self.bands[:6] + self.bands_extra[:6]) + self.reserved[:8]
-
-    @classmethod
-    def from_bytes(cls, data: bytes) -> EQModule:
-        if len(data) < cls.SIZE:
-            data = data + b"\x00" * (cls.SIZE - len(data))
-        return cls(
-            header=data[0], enabled=data[1], type=data[2],
-            bands=list(data[3:9]),
-            bands_extra=list(data[9:15]),
-            reserved=data[15:23],
+            self.bands, self.bands_extra, self.reserved,
         )
 
+    def to_dict(self) -> dict:
+        return {
+            **EffectModule.to_dict(self),
+            "bands": list(self.bands),
+            "bands_extra": list(self.bands_extra),
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class ModulationModule(EffectModule):
     """Modulation module (15 bytes)."""
 
     SIZE: ClassVar[int] = 15
+    _STRUCT: ClassVar[struct.Struct] = _MOD_STRUCT
     rate: int = 0
     level: int = 0
     depth: int = 0
     param4: int = 0
     param5: int = 0
-    reserved: bytes = field(default_factory=lambda: b"\x00" * 7)
+    reserved: bytes = _ZERO7
 
-    def to_bytes(self) -> bytes:
-        return bytes([
+    def _pack_args(self) -> tuple:
+        return (
             self.header, self.enabled, self.type,
-            self.rate, self.level, self.depth,
-            self.param4, self.param5,
-        ]) + self.reserved[:7]
-
-    @classmethod
-    def from_bytes(cls, data: bytes) -> ModulationModule:
-        if len(data) < cls.SIZE:
-            data = data + b"\x00" * (cls.SIZE - len(data))
-        return cls(
-            header=data[0], enabled=data[1], type=data[2],
-            rate=data[3], level=data[4], depth=data[5],
-            param4=data[6], param5=data[7],
-            reserved=data[8:15],
+            self.rate, self.level, self.depth, self.param4, self.param5,
+            self.reserved,
         )
 
+    def to_dict(self) -> dict:
+        return {
+            **EffectModule.to_dict(self),
+            "rate": self.rate,
+            "level": self.level,
+            "depth": self.depth,
+            "param4": self.param4,
+            "param5": self.param5,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class DelayModule(EffectModule):
     """Delay module (17 bytes).
 
@@ -257,6 +340,7 @@ class DelayModule(EffectModule):
     """
 
     SIZE: ClassVar[int] = 17
+    _STRUCT: ClassVar[struct.Struct] = _DELAY_STRUCT
     FIELD_WIDTHS: ClassVar[dict[str, int]] = {"time_ms": 2}
     level: int = 0
     feedback: int = 0
@@ -264,63 +348,57 @@ class DelayModule(EffectModule):
     subdivision: int = 0
     param5: int = 0
     param6: int = 0
-    reserved: bytes = field(default_factory=lambda: b"\x00" * 7)
+    reserved: bytes = _ZERO7
 
-    def to_bytes(self) -> bytes:
-        time_lo = self.time_ms & 0xFF
-        time_hi = (self.time_ms >> 8) & 0xFF
-        return bytes([
+    def _pack_args(self) -> tuple:
+        return (
             self.header, self.enabled, self.type,
-            self.level, self.feedback, time_lo, time_hi,
+            # Masked to 16 bits, as the byte-wise encoding always did
+            self.level, self.feedback, self.time_ms & 0xFFFF,
             self.subdivision, self.param5, self.param6,
-        ]) + self.reserved[:7]
-
-    @classmethod
-    def from_bytes(cls, data: bytes) -> DelayModule:
-        if len(data) < cls.SIZE:
-            data = data + b"\x00" * (cls.SIZE - len(data))
-        time_ms = data[5] | (data[6] << 8)
-        return cls(
-            header=data[0], enabled=data[1], type=data[2],
-            level=data[3], feedback=data[4],
-            time_ms=time_ms,
-            subdivision=data[7], param5=data[8], param6=data[9],
-            reserved=data[10:17],
+            self.reserved,
         )
 
     def to_dict(self) -> dict:
-        d = super().to_dict()
-        d["time_ms"] = self.time_ms
-        return d
-
-
-@dataclass
+        return {
+            **EffectModule.to_dict(self),
+            "level": self.level,
+            "feedback": self.feedback,
+            "time_ms": self.time_ms,
+            "subdivision": self.subdivision,
+            "param5": self.param5,
+            "param6": self.param6,
+        }
+
+
+@dataclass(slots=True)
 class ReverbModule(EffectModule):
     """Reverb module (13 bytes)."""
 
     SIZE: ClassVar[int] = 13
+    _STRUCT: ClassVar[struct.Struct] = _REVERB_STRUCT
     pre_delay: int = 0
     level: int = 0
     decay: int = 0
     tone: int = 0
-    reserved: bytes = field(default_factory=lambda: b"\x00" * 6)
+    reserved: bytes = _ZERO6
 
-    def to_bytes(self) -> bytes:
-        return bytes([
+    def _pack_args(self) -> tuple:
+        return (
             self.header, self.enabled, self.type,
             self.pre_delay, self.level, self.decay, self.tone,
-        ]) + self.reserved[:6]
-
-    @classmethod
-    def from_bytes(cls, data: bytes) -> ReverbModule:
-        if len(data) < cls.SIZE:
-            data = data + b"\x00" * (cls.SIZE - len(data))
-        return cls(
-            header=data[0], enabled=data[1], type=data[2],
-            pre_delay=data[3], level=data[4], decay=data[5], tone=data[6],
-            reserved=data[7:13],
+            self.reserved,
         )
 
+    def to_dict(self) -> dict:
+        return {
+            **EffectModule.to_dict(self),
+            "pre_delay": self.pre_delay,
+            "level": self.level,
+            "decay": self.decay,
+            "tone": self.tone,
+        }
+
 
 # Map module names to classes for factory use
 MODULE_CLASSES: dict[str, type[EffectModule]] = {
@@ -10,6 +10,7 @@ Layout (offsets relative to preset start)::
 
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass, field
 from typing import ClassVar
 
@@ -42,11 +43,43 @@ OFF_DELAY = 0x81          # 17 bytes
 OFF_REVERB = 0x92         # 13 bytes
 OFF_TAIL = 0x9F           # opaque bytes after the last modeled module
 TAIL_SIZE = PRESET_SIZE - OFF_TAIL  # 353 bytes
+_EMPTY_TAIL = bytes(TAIL_SIZE)
+# The size field is the same for every preset: everything from the name on.
+_SIZE_FIELD_BYTES = (PRESET_SIZE - OFF_SIZE - 2).to_bytes(2, "big")
 
 MODULE_NAMES = ["fx", "od", "amp", "cab", "ns", "eq", "mod", "delay", "reverb"]
+_MODULE_NAME_SET = frozenset(MODULE_NAMES)
 
+_MODULE_CHAIN = (
+    FXModule, DistortionModule, AmpModule, CabModule, NoiseGateModule,
+    EQModule, ModulationModule, DelayModule, ReverbModule,
+)
+
+# The whole 512-byte layout as one flat struct: effect order, size
+# field, name, every module's own layout in chain order, then the tail.
+# The modules sit back to back, so no offsets are needed in between.
+_PRESET_STRUCT = struct.Struct(
+    "<10s2s14s"
+    + "".join(cls._STRUCT.format.lstrip("<") for cls in _MODULE_CHAIN)
+    + f"{TAIL_SIZE}s"
+)
+
+
+def _module_value_spans() -> list[tuple[type, int, int]]:
+    """(module class, start, stop) of each module's values when unpacked."""
+    spans = []
+    start = 3  # effect order, size field, name
+    for cls in _MODULE_CHAIN:
+        stop = start + len(cls._STRUCT.unpack(bytes(cls.SIZE)))
+        spans.append((cls, start, stop))
+        start = stop
+    return spans
+
+
+_MODULE_VALUE_SPANS = _module_value_spans()
 
-@dataclass
+
+@dataclass(slots=True)
 class Preset:
     """A single device preset (512 bytes)."""
 
@@ -65,65 +98,89 @@ class Preset:
     reverb: ReverbModule = field(default_factory=ReverbModule)
     # Bytes 0x9F-0x1FF are not yet reverse-engineered; carry them through
     # serialization untouched so device data is never silently zeroed.
-    tail: bytes = field(default_factory=lambda: b"\x00" * TAIL_SIZE)
+    tail: bytes = _EMPTY_TAIL
+    # Padded 14-byte name, maintained by __setattr__
+    _name_bytes: bytes = field(init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        if name == "name":
+            # Encoded, truncated and NUL-padded once per rename
+            object.__setattr__(
+                self,
+                "_name_bytes",
+                value.encode("ascii", errors="replace")[:14].ljust(14, b"\x00"),
+            )
 
     def to_bytes(self) -> bytes:
-        """Serialize the preset to a 0x200-byte structure."""
-        buf = bytearray(PRESET_SIZE)
-
-        # Effect order (10 bytes)
-        for i, val in enumerate(self.effect_order[:10]):
-            buf[OFF_EFFECT_ORDER + i] = val & 0xFF
-
-        # Calculate data size (everything from name onward)
-        data_size = PRESET_SIZE - OFF_SIZE - 2
-        buf[OFF_SIZE] = (data_size >> 8) & 0xFF
-        buf[OFF_SIZE + 1] = data_size & 0xFF
-
-        # Name (14 bytes, null-padded ASCII)
-        name_bytes = self.name.encode("ascii", errors="replace")[:14]
-        buf[OFF_NAME : OFF_NAME + len(name_bytes)] = name_bytes
-
-        # Effect modules
-        buf[OFF_FX : OFF_FX + FXModule.SIZE] = self.fx.to_bytes()
-        buf[OFF_OD : OFF_OD + DistortionModule.SIZE] = self.od.to_bytes()
-        buf[OFF_AMP : OFF_AMP + AmpModule.SIZE] = self.amp.to_bytes()
-        buf[OFF_CAB : OFF_CAB + CabModule.SIZE] = self.cab.to_bytes()
-        buf[OFF_NS : OFF_NS + NoiseGateModule.SIZE] = self.ns.to_bytes()
-        buf[OFF_EQ : OFF_EQ + EQModule.SIZE] = self.eq.to_bytes()
-        buf[OFF_MOD : OFF_MOD + ModulationModule.SIZE] = self.mod.to_bytes()
-        buf[OFF_DELAY : OFF_DELAY + DelayModule.SIZE] = self.delay.to_bytes()
-        buf[OFF_REVERB : OFF_REVERB + ReverbModule.SIZE] = self.reverb.to_bytes()
-
-        # Opaque tail bytes, preserved verbatim
-        buf[OFF_TAIL:PRESET_SIZE] = self.tail[:TAIL_SIZE].ljust(TAIL_SIZE, b"\x00")
-
-        return bytes(buf)
+        """Serialize the preset to a 0x200-byte structure.
+
+        Always packed fresh: modules are edited in place
+        (``preset.amp.bass = 3``), so a cached copy would go stale.
+        """
+        try:
+            return _PRESET_STRUCT.pack(*self._pack_args())
+        except struct.error as exc:
+            raise ValueError(f"Preset field out of range: {exc}") from None
+
+    def pack_into(self, buf: bytearray, offset: int) -> None:
+        """Serialize the preset into *buf* at *offset*.
+
+        All 512 bytes are written, so *buf* need not be zeroed first.
+        """
+        try:
+            _PRESET_STRUCT.pack_into(buf, offset, *self._pack_args())
+        except struct.error as exc:
+            raise ValueError(f"Preset field out of range: {exc}") from None
+
+    def _pack_args(self) -> tuple:
+        """Field values in ``_PRESET_STRUCT`` order."""
+        return (
+            bytes(val & 0xFF for val in self.effect_order[:10]),
+            _SIZE_FIELD_BYTES,
+            self._name_bytes,
+            *self.fx._pack_args(),
+            *self.od._pack_args(),
+            *self.amp._pack_args(),
+            *self.cab._pack_args(),
+            *self.ns._pack_args(),
+            *self.eq._pack_args(),
+            *self.mod._pack_args(),
+            *self.delay._pack_args(),
+            *self.reverb._pack_args(),
+            self.tail,
+        )
 
     @classmethod
     def from_bytes(cls, data: bytes) -> Preset:
-        """Deserialize a preset from a 0x200-byte (or larger) structure."""
-        if len(data) < PRESET_SIZE:
-            data = data + b"\x00" * (PRESET_SIZE - len(data))
+        """Deserialize a preset from a 0x200-byte (or larger) structure.
 
-        effect_order = list(data[OFF_EFFECT_ORDER : OFF_EFFECT_ORDER + 10])
+        The whole preset is unpacked with a single struct call; each
+        module is then built from its share of the values.
+        """
+        if len(data) < PRESET_SIZE:
+            data = bytes(data).ljust(PRESET_SIZE, b"\x00")
+        values = _PRESET_STRUCT.unpack_from(data, 0)
 
-        name_bytes = data[OFF_NAME : OFF_NAME + 14]
-        name = name_bytes.split(b"\x00")[0].decode("ascii", errors="replace")
+        name = values[2].split(b"\x00")[0].decode("ascii", errors="replace")
+        fx, od, amp, cab, ns, eq, mod, delay, reverb = (
+            module_cls._from_values(values[start:stop])
+            for module_cls, start, stop in _MODULE_VALUE_SPANS
+        )
 
         return cls(
-            effect_order=effect_order,
+            effect_order=list(values[0]),
             name=name,
-            fx=FXModule.from_bytes(data[OFF_FX : OFF_FX + FXModule.SIZE]),
-            od=DistortionModule.from_bytes(data[OFF_OD : OFF_OD + DistortionModule.SIZE]),
-            amp=AmpModule.from_bytes(data[OFF_AMP : OFF_AMP + AmpModule.SIZE]),
-            cab=CabModule.from_bytes(data[OFF_CAB : OFF_CAB + CabModule.SIZE]),
-            ns=NoiseGateModule.from_bytes(data[OFF_NS : OFF_NS + NoiseGateModule.SIZE]),
-            eq=EQModule.from_bytes(data[OFF_EQ : OFF_EQ + EQModule.SIZE]),
-            mod=ModulationModule.from_bytes(data[OFF_MOD : OFF_MOD + ModulationModule.SIZE]),
-            delay=DelayModule.from_bytes(data[OFF_DELAY : OFF_DELAY + DelayModule.SIZE]),
-            reverb=ReverbModule.from_bytes(data[OFF_REVERB : OFF_REVERB + ReverbModule.SIZE]),
-            tail=bytes(data[OFF_TAIL:PRESET_SIZE]),
+            fx=fx,
+            od=od,
+            amp=amp,
+            cab=cab,
+            ns=ns,
+            eq=eq,
+            mod=mod,
+            delay=delay,
+            reverb=reverb,
+            tail=values[-1],
         )
 
     def to_dict(self) -> dict:
@@ -146,20 +203,9 @@ class Preset:
 
     def get_module(self, name: str):
         """Get an effect module by name."""
-        modules = {
-            "fx": self.fx,
-            "od": self.od,
-            "amp": self.amp,
-            "cab": self.cab,
-            "ns": self.ns,
-            "eq": self.eq,
-            "mod": self.mod,
-            "delay": self.delay,
-            "reverb": self.reverb,
-        }
-        if name not in modules:
-            raise ValueError(f"Unknown module '{name}'. Valid: {list(modules)}")
-        return modules[name]
+        if name not in _MODULE_NAME_SET:
+            raise ValueError(f"Unknown module '{name}'. Valid: {MODULE_NAMES}")
+        return getattr(self, name)
 
     def __repr__(self) -> str:
         return f"Preset(name={self.name!r})"
@@ -15,10 +15,13 @@ them as provisional.
 
 from __future__ import annotations
 
+import struct
+from collections.abc import Callable
 from dataclasses import dataclass, field, replace
 from enum import IntEnum
+from functools import cache, lru_cache
 
-from .framing import build_frame, build_chunked_frames
+from .framing import build_frame, build_frame_factory, build_chunked_frames
 
 #: Device replies reuse the request ID with the high bit cleared.
 RESPONSE_MASK = 0x7F
@@ -29,6 +32,8 @@ MODULE_BLOCK_SIZE = MODULE_BLOCK_WORDS * 2
 #: Words 0 and 1 are the ON/OFF status and effect type; the rest are parameters.
 MAX_MODULE_PARAMS = MODULE_BLOCK_WORDS - 2
 
+_MODULE_BLOCK_STRUCT = struct.Struct(f"<{MODULE_BLOCK_WORDS}H")
+
 
 class Command(IntEnum):
     """Command group identifiers."""
@@ -182,6 +187,15 @@ MODULE_COMMAND_MAP: dict[str, Command] = {
 #: the pedal calls the overdrive/distortion module DS.
 MODULE_NAME_ALIASES: dict[str, str] = {"od": "ds", "drive": "ds"}
 
+# Canonical names and aliases resolved to their command in one lookup.
+_MODULE_LOOKUP: dict[str, Command] = {
+    **MODULE_COMMAND_MAP,
+    **{
+        alias: MODULE_COMMAND_MAP[name]
+        for alias, name in MODULE_NAME_ALIASES.items()
+    },
+}
+
 #: Length of the ASCII name field in a PRESET_NAME message.
 PRESET_NAME_LENGTH = 16
 
@@ -248,9 +262,29 @@ def address_to_slot(bank: int, position: str) -> int:
     )
 
 
-def build_command(command: Command, payload: bytes = b"") -> bytes:
-    """Build a single 64-byte HID report for a command."""
-    return build_frame(command.value, payload)
+def build_command(command: Command | int, payload: bytes = b"") -> bytes:
+    """Build a single 64-byte HID report for a command.
+
+    :class:`Command` is an ``IntEnum``, so it goes to the framer as-is;
+    a plain int command ID is accepted too. Reports built from ``bytes``
+    payloads are memoized, so repeated polls and reads cost a lookup.
+    """
+    if type(payload) is bytes:
+        return _cached_frame(command, payload)
+    return build_frame(command, payload)
+
+
+@lru_cache(maxsize=256)
+def _cached_frame(command: int, payload: bytes) -> bytes:
+    """Memoized :func:`build_frame`; single-frame payloads are at most 56
+    bytes, so the bounded cache pins little memory."""
+    return build_frame(command, payload)
+
+
+@cache
+def _fixed_builder(command: Command, payload_len: int) -> Callable[[bytes], bytes]:
+    """Specialised frame builder for a hot fixed-size command."""
+    return build_frame_factory(command, payload_len)
 
 
 # ---------------------------------------------------------------------------
@@ -258,7 +292,7 @@ def build_command(command: Command, payload: bytes = b"") -> bytes:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleBlock:
     """The state of one effect module.
 
@@ -283,13 +317,18 @@ def encode_module_block(block: ModuleBlock) -> bytes:
             f"got {len(block.params)}"
         )
 
-    words = [1 if block.enabled else 0, block.effect_type, *block.params]
-    for word in words:
-        if not 0 <= word <= 0xFFFF:
-            raise ValueError(f"Module word must be 0-65535, got {word}")
-    words += [0] * (MODULE_BLOCK_WORDS - len(words))
-
-    return b"".join(w.to_bytes(2, "little") for w in words)
+    words = (1 if block.enabled else 0, block.effect_type, *block.params)
+    try:
+        return _MODULE_BLOCK_STRUCT.pack(
+            *words, *(0,) * (MODULE_BLOCK_WORDS - len(words))
+        )
+    except struct.error:
+        for word in words:
+            if not 0 <= word <= 0xFFFF:
+                raise ValueError(
+                    f"Module word must be 0-65535, got {word}"
+                ) from None
+        raise
 
 
 def decode_module_block(payload: bytes) -> ModuleBlock:
@@ -300,22 +339,21 @@ def decode_module_block(payload: bytes) -> ModuleBlock:
             f"got {len(payload)}"
         )
 
-    words = [
-        int.from_bytes(payload[i : i + 2], "little")
-        for i in range(0, MODULE_BLOCK_SIZE, 2)
-    ]
+    words = _MODULE_BLOCK_STRUCT.unpack(payload)
     return ModuleBlock(
-        enabled=bool(words[0]), effect_type=words[1], params=words[2:]
+        enabled=bool(words[0]), effect_type=words[1], params=list(words[2:])
     )
 
 
 def _module_command(module: str) -> Command:
-    name = MODULE_NAME_ALIASES.get(module.lower(), module.lower())
-    if name not in MODULE_COMMAND_MAP:
-        raise ValueError(
-            f"Unknown module '{module}'. Valid: {list(MODULE_COMMAND_MAP)}"
-        )
-    return MODULE_COMMAND_MAP[name]
+    command = _MODULE_LOOKUP.get(module)
+    if command is None:
+        command = _MODULE_LOOKUP.get(module.lower())
+        if command is None:
+            raise ValueError(
+                f"Unknown module '{module}'. Valid: {list(MODULE_COMMAND_MAP)}"
+            )
+    return command
 
 
 def build_module_block(module: str, block: ModuleBlock) -> bytes:
@@ -324,7 +362,8 @@ def build_module_block(module: str, block: ModuleBlock) -> bytes:
     This is how MOOER Studio edits effects: every knob turn resends the
     whole block for that module rather than a single-parameter delta.
     """
-    return build_command(_module_command(module), encode_module_block(block))
+    builder = _fixed_builder(_module_command(module), MODULE_BLOCK_SIZE)
+    return builder(encode_module_block(block))
 
 
 # ---------------------------------------------------------------------------
@@ -332,7 +371,7 @@ def build_module_block(module: str, block: ModuleBlock) -> bytes:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class PresetRecord:
     """A complete preset as the pedal stores it.
 
@@ -361,8 +400,7 @@ class PresetRecord:
     @property
     def name(self) -> str:
         """The preset name with padding removed."""
-        text = self.name_raw.split(b"\x00")[0]
-        return text.decode("ascii", errors="replace").rstrip()
+        return _clean_name(self.name_raw)
 
     def with_name(self, name: str) -> "PresetRecord":
         """Return a copy renamed to *name*, NUL-padded to 16 bytes."""
@@ -370,6 +408,25 @@ class PresetRecord:
         return replace(self, name_raw=encoded.ljust(PRESET_NAME_LENGTH, b"\x00"))
 
 
+def _clean_name(name_raw: bytes) -> str:
+    text = name_raw.split(b"\x00")[0]
+    return text.decode("ascii", errors="replace").rstrip()
+
+
+def decode_record_name(payload: bytes) -> str:
+    """Read only the name of a 245-byte preset record payload.
+
+    For callers that just need to know whether a record is named, this
+    skips unpacking the nine module blocks.
+    """
+    if len(payload) != PRESET_RECORD_SIZE:
+        raise ValueError(
+            f"Preset record must be {PRESET_RECORD_SIZE} bytes, "
+            f"got {len(payload)}"
+        )
+    return _clean_name(payload[1 : 1 + PRESET_NAME_LENGTH])
+
+
 def decode_preset_record(payload: bytes) -> PresetRecord:
     """Parse a 245-byte preset record payload."""
     if len(payload) != PRESET_RECORD_SIZE:
@@ -378,11 +435,14 @@ def decode_preset_record(payload: bytes) -> PresetRecord:
             f"got {len(payload)}"
         )
 
+    # Blocks are unpacked in place; the length check above already
+    # guarantees each one is whole.
     modules: dict[Command, ModuleBlock] = {}
     offset = 1 + PRESET_NAME_LENGTH
     for command in MODULE_CHAIN:
-        modules[command] = decode_module_block(
-            payload[offset : offset + MODULE_BLOCK_SIZE]
+        words = _MODULE_BLOCK_STRUCT.unpack_from(payload, offset)
+        modules[command] = ModuleBlock(
+            enabled=bool(words[0]), effect_type=words[1], params=list(words[2:])
         )
         offset += MODULE_BLOCK_SIZE
 
@@ -412,11 +472,29 @@ def encode_preset_record(record: PresetRecord) -> bytes:
             f"got {len(record.name_raw)}"
         )
 
-    out = bytes([record.slot]) + record.name_raw
-    for command in MODULE_CHAIN:
-        block = record.modules.get(command, ModuleBlock(enabled=False, effect_type=0))
-        out += encode_module_block(block)
-    return out + record.tail
+    # One join instead of growing the record block by block
+    modules = record.modules
+    return b"".join((
+        bytes((record.slot,)),
+        record.name_raw,
+        *(
+            encode_module_block(modules[command])
+            if command in modules else _EMPTY_MODULE_BLOCK
+            for command in MODULE_CHAIN
+        ),
+        record.tail,
+    ))
+
+
+# What an absent module encodes to: off, effect type 0, no parameters
+_EMPTY_MODULE_BLOCK = bytes(MODULE_BLOCK_SIZE)
+
+
+# Only 200 possible select commands; build them all once.
+_SELECT_PRESET_FRAMES = tuple(
+    build_command(Command.SELECT_PRESET, bytes([slot]))
+    for slot in range(FIRST_PRESET_SLOT, LAST_PRESET_SLOT + 1)
+)
 
 
 def build_select_preset_slot(slot: int) -> bytes:
@@ -427,7 +505,7 @@ def build_select_preset_slot(slot: int) -> bytes:
     0-based, then 0x34.
     """
     _check_slot(slot)
-    return build_command(Command.SELECT_PRESET, bytes([slot]))
+    return _SELECT_PRESET_FRAMES[slot - FIRST_PRESET_SLOT]
 
 
 def build_save_preset(slot: int, name: str) -> bytes:
@@ -468,7 +546,8 @@ def build_write_preset(
     for command in MODULE_CHAIN:
         block = modules.get(command)
         if block is not None:
-            reports.append(build_command(command, encode_module_block(block)))
+            builder = _fixed_builder(command, MODULE_BLOCK_SIZE)
+            reports.append(builder(encode_module_block(block)))
     reports.append(build_save_preset(slot, name))
     return reports
 
@@ -490,9 +569,16 @@ def build_set_exp_assign(target: int, enabled: int = 1) -> bytes:
     )
 
 
+# Parameterless requests never change, so each frame is built once at import.
+_HELLO_FRAME = build_command(Command.HELLO, b"\x01")
+
+
 def build_hello() -> bytes:
     """Build the first message the editor sends after connecting."""
-    return build_command(Command.HELLO, b"\x01")
+    return _HELLO_FRAME
+
+
+_DUMP_PRESETS_FRAME = build_command(Command.DUMP_PRESETS, b"\x01")
 
 
 def build_dump_presets() -> bytes:
@@ -501,12 +587,15 @@ def build_dump_presets() -> bytes:
     Each reply is a 252-byte message split across four 63-byte HID
     reports, so read them with a reassembling reader.
     """
-    return build_command(Command.DUMP_PRESETS, b"\x01")
+    return _DUMP_PRESETS_FRAME
+
+
+_READ_IR_LIST_FRAME = build_command(Command.READ_IR_LIST, b"\x01")
 
 
 def build_read_ir_list() -> bytes:
     """Request the user IR slot names. Replies 0x41: 40 x 16-byte names."""
-    return build_command(Command.READ_IR_LIST, b"\x01")
+    return _READ_IR_LIST_FRAME
 
 
 #: The IR list reply holds this many fixed-width name fields.
@@ -559,13 +648,16 @@ def decode_active_state(payload: bytes) -> PresetRecord:
     return PresetRecord(slot=payload[0], modules=modules, tail=payload[offset:])
 
 
+_READ_ACTIVE_FRAME = build_command(Command.READ_ACTIVE, b"\x01")
+
+
 def build_read_active_preset() -> bytes:
     """Request the currently active preset's state. Replies 0x30.
 
     The 0x30 payload is a slot byte, one flag byte, then the same nine
     module blocks and 12-byte tail as a preset record.
     """
-    return build_command(Command.READ_ACTIVE, b"\x01")
+    return _READ_ACTIVE_FRAME
 
 
 def _check_slot(slot: int) -> None:
@@ -630,11 +722,18 @@ def build_write_preset_record(record: PresetRecord) -> list[bytes]:
     )
 
 
+# Like preset select, the CTRL read takes one of 200 slots; build them once.
+_READ_CTRL_CONFIG_FRAMES = tuple(
+    build_command(Command.READ_CTRL_CONFIG, bytes([slot]))
+    for slot in range(LAST_PRESET_SLOT)
+)
+
+
 def build_read_ctrl_config(slot: int) -> bytes:
     """Read a preset's CTRL configuration. Note the slot is 0-based."""
     if not 0 <= slot < LAST_PRESET_SLOT:
         raise ValueError(f"CTRL slot must be 0-{LAST_PRESET_SLOT - 1}, got {slot}")
-    return build_command(Command.READ_CTRL_CONFIG, bytes([slot]))
+    return _READ_CTRL_CONFIG_FRAMES[slot]
 
 
 def build_write_ctrl_config(slot: int, flags: list[bool]) -> bytes:
@@ -671,7 +770,7 @@ def decode_ctrl_config(payload: bytes) -> tuple[int, dict[Command, bool]]:
 def _u16_command(command: Command, value: int) -> bytes:
     if not 0 <= value <= 0xFFFF:
         raise ValueError(f"Value must be 0-65535, got {value}")
-    return build_command(command, value.to_bytes(2, "little"))
+    return _fixed_builder(command, 2)(value.to_bytes(2, "little"))
 
 
 def build_set_input_level(value: int) -> bytes:
@@ -689,33 +788,53 @@ def build_set_brightness(value: int) -> bytes:
     return _u16_command(Command.SCREEN_BRIGHTNESS, value)
 
 
-def build_set_cab_sim_thru(left: bool, right: bool) -> bytes:
-    """Enable or disable cabinet simulation per output channel."""
-    return build_command(
+# Indexed by (left, right) and by the enabled flag respectively.
+_CAB_SIM_THRU_FRAMES = {
+    (left, right): build_command(
         Command.CAB_SIM_THRU,
-        (1 if left else 0).to_bytes(2, "little")
-        + (1 if right else 0).to_bytes(2, "little"),
+        int(left).to_bytes(2, "little") + int(right).to_bytes(2, "little"),
     )
+    for left in (False, True)
+    for right in (False, True)
+}
+_SPILLOVER_FRAMES = (
+    _u16_command(Command.SPILLOVER, 0),
+    _u16_command(Command.SPILLOVER, 1),
+)
+
+
+def build_set_cab_sim_thru(left: bool, right: bool) -> bytes:
+    """Enable or disable cabinet simulation per output channel."""
+    return _CAB_SIM_THRU_FRAMES[bool(left), bool(right)]
 
 
 def build_set_spillover(enabled: bool) -> bytes:
     """Enable or disable delay/reverb spill-over between presets."""
-    return _u16_command(Command.SPILLOVER, 1 if enabled else 0)
+    return _SPILLOVER_FRAMES[bool(enabled)]
+
+
+_BACKUP_BEGIN_FRAME = build_command(Command.BACKUP_BEGIN, b"\x01")
 
 
 def build_backup_begin() -> bytes:
     """Open a backup read. The editor sends this before reading presets."""
-    return build_command(Command.BACKUP_BEGIN, b"\x01")
+    return _BACKUP_BEGIN_FRAME
+
+
+_RESTORE_BEGIN_FRAME = build_command(Command.RESTORE_BEGIN, b"\x01")
 
 
 def build_restore_begin() -> bytes:
     """Open a restore. Bracket the whole restore between this and the end."""
-    return build_command(Command.RESTORE_BEGIN, b"\x01")
+    return _RESTORE_BEGIN_FRAME
+
+
+_RESTORE_END_FRAME = build_command(Command.RESTORE_END, b"\x01")
 
 
 def build_restore_end() -> bytes:
     """Close a restore."""
-    return build_command(Command.RESTORE_END, b"\x01")
+    return _RESTORE_END_FRAME
 
 
 # ---------------------------------------------------------------------------
@@ -844,6 +963,9 @@ def split_user_model_list(names: list[str]) -> dict[str, list[dict]]:
 #: -2 dB -> 28.
 EQ_GAIN_ZERO = 32
 
+# Nine little-endian u16 words: enable, three freq/gain pairs, two cuts.
+_GLOBAL_EQ_STRUCT = struct.Struct("<9H")
+
 
 def eq_gain_to_db(value: int) -> float:
     """Convert a raw global-EQ gain word to decibels."""
@@ -888,16 +1010,14 @@ def build_set_global_eq(eq: GlobalEQ) -> bytes:
     for word in words:
         if not 0 <= word <= 0xFFFF:
             raise ValueError(f"Global EQ word out of range: {word}")
-    return build_command(
-        Command.GLOBAL_EQ, b"".join(w.to_bytes(2, "little") for w in words)
-    )
+    return build_command(Command.GLOBAL_EQ, _GLOBAL_EQ_STRUCT.pack(*words))
 
 
 def decode_global_eq(payload: bytes) -> GlobalEQ:
     """Parse an 18-byte global EQ payload (0xD1 write or 0x11 stream)."""
-    if len(payload) != 18:
+    if len(payload) != _GLOBAL_EQ_STRUCT.size:
         raise ValueError(f"Global EQ block must be 18 bytes, got {len(payload)}")
-    w = [int.from_bytes(payload[i:i+2], "little") for i in range(0, 18, 2)]
+    w = _GLOBAL_EQ_STRUCT.unpack(payload)
     return GlobalEQ(
         enabled=bool(w[0]),
         low_freq=w[1], low_gain_db=eq_gain_to_db(w[2]),
@@ -22,15 +22,27 @@ Note that the preamble is *not* covered, but the size field is.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import struct
+from collections.abc import Callable
 
-from ..utils.crc import crc16
+from ..utils.crc import crc16, crc16_update
 
 PREAMBLE = b"\xAA\x55"
+# The preamble's two bytes, for checks that index rather than slice
+_PRE0, _PRE1 = PREAMBLE
 HID_REPORT_SIZE = 64
 # 64 - 1(hid_size) - 2(preamble) - 2(size) - 1(cmd) - 2(checksum)
 MAX_PAYLOAD_PER_FRAME = 56
 
+# The size field is little-endian, the checksum big-endian.
+_U16LE = struct.Struct("<H")
+_U16BE = struct.Struct(">H")
+# Zero padding that fills a report after a short payload
+_PADDING = bytes(MAX_PAYLOAD_PER_FRAME)
+# The same for a chunk of a split message, and each possible length prefix
+_REPORT_PADDING = bytes(HID_REPORT_SIZE - 1)
+_CHUNK_LENGTHS = tuple(bytes((n,)) for n in range(HID_REPORT_SIZE))
+
 
 def frame_checksum(size_and_body: bytes) -> int:
     """Compute the 2-byte frame checksum.
@@ -46,12 +58,44 @@ def frame_checksum(size_and_body: bytes) -> int:
     return crc16(size_and_body)
 
 
-@dataclass
 class Frame:
-    """A parsed protocol frame."""
+    """A parsed protocol frame. Immutable; one is built per message.
+
+    *payload* may be any read-only buffer, such as a ``memoryview`` of
+    the received report. It is copied to ``bytes`` the first time
+    :attr:`payload` is read, so frames that are only filtered by
+    :attr:`command` and then dropped never copy their payload.
+    """
+
+    __slots__ = ("command", "_payload")
 
     command: int
-    payload: bytes
+
+    def __init__(self, command: int, payload: bytes = b"") -> None:
+        object.__setattr__(self, "command", command)
+        object.__setattr__(self, "_payload", payload)
+
+    @property
+    def payload(self) -> bytes:
+        payload = self._payload
+        if type(payload) is not bytes:
+            payload = bytes(payload)
+            object.__setattr__(self, "_payload", payload)
+        return payload
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Frame):
+            return NotImplemented
+        return self.command == other.command and self.payload == other.payload
+
+    def __hash__(self) -> int:
+        return hash((self.command, self.payload))
 
     def __repr__(self) -> str:
         return (
@@ -79,14 +123,58 @@ def build_frame(command: int, payload: bytes = b"") -> bytes:
             f"Payload of {len(payload)} bytes exceeds single-frame limit of "
             f"{MAX_PAYLOAD_PER_FRAME}; use build_chunked_frames()"
         )
-    body = bytes([command]) + payload
-    size = len(body).to_bytes(2, "little")
-    checksum = frame_checksum(size + body).to_bytes(2, "big")
-    frame = PREAMBLE + size + body + checksum
-    hid_size = len(frame)
-    # HID report: 1-byte size prefix + frame + zero padding to 64 bytes
-    report = bytes([hid_size]) + frame + b"\x00" * (HID_REPORT_SIZE - 1 - len(frame))
-    return report
+    n = len(payload)
+    body_size = 1 + n
+
+    # HID report: 1-byte size prefix + frame + zero padding to 64 bytes.
+    # The pieces are joined straight into the final bytes object; the
+    # checksum is chained over the header and payload, so no scratch
+    # bytearray is filled and then copied out.
+    head = bytes(
+        (4 + body_size + 2, _PRE0, _PRE1, body_size & 0xFF, body_size >> 8, command)
+    )
+    checksum = ~crc16_update(crc16_update(0, head[3:]), payload) & 0xFFFF
+    return b"".join(
+        (head, payload, _U16BE.pack(checksum), _PADDING[: MAX_PAYLOAD_PER_FRAME - n])
+    )
+
+
+def build_frame_factory(
+    command: int, payload_len: int
+) -> Callable[[bytes], bytes]:
+    """Return a :func:`build_frame` specialised to one command and size.
+
+    The HID size, preamble, size field and command byte never change
+    for a given (command, payload length), so they and the trailing
+    padding are built once, and the checksum's pass over the size field
+    and command byte is folded into a saved CRC state. Each call only
+    runs the CRC over the payload and joins the pieces.
+
+    Args:
+        command: Single-byte command group ID.
+        payload_len: Exact payload length every call will supply.
+
+    Returns:
+        ``build(payload) -> bytes``, producing the same 64-byte report as
+        ``build_frame(command, payload)``.
+
+    Raises:
+        ValueError: If *payload_len* does not fit in a single frame.
+    """
+    template = build_frame(command, bytes(payload_len))
+    head = template[:6]
+    padding = template[6 + payload_len + 2 :]
+    seed = crc16_update(0, head[3:])
+
+    def build(payload: bytes) -> bytes:
+        if len(payload) != payload_len:
+            raise ValueError(
+                f"Expected a {payload_len}-byte payload, got {len(payload)}"
+            )
+        checksum = ~crc16_update(seed, payload) & 0xFFFF
+        return b"".join((head, payload, _U16BE.pack(checksum), padding))
+
+    return build
 
 
 def build_chunked_frames(command: int, payload: bytes) -> list[bytes]:
@@ -99,45 +187,65 @@ def build_chunked_frames(command: int, payload: bytes) -> list[bytes]:
     For small messages that fit in a single frame, this returns a list with
     one element identical to :func:`build_frame`.
     """
-    body = bytes([command]) + payload
-    size_bytes = len(body).to_bytes(2, "little")
-    checksum = frame_checksum(size_bytes + body).to_bytes(2, "big")
-    full_message = PREAMBLE + size_bytes + body + checksum
-
-    # If it fits in one report (with the 1-byte hid_size prefix)
-    if len(full_message) <= HID_REPORT_SIZE - 1:
-        return [build_frame(command, payload)]
-
-    # Split into 63-byte chunks (first byte of each report is chunk length)
-    frames: list[bytes] = []
-    offset = 0
-    while offset < len(full_message):
-        chunk = full_message[offset : offset + 63]
-        report = bytes([len(chunk)]) + chunk + b"\x00" * (63 - len(chunk))
-        frames.append(report)
-        offset += 63
+    # Lay the whole message out in one buffer; the checksum is taken over
+    # a view of it, so no separate body or size+body copies are made.
+    body_size = 1 + len(payload)
+    end = 4 + body_size
+    full_message = bytearray(end + 2)
+    full_message[0:2] = PREAMBLE
+    _U16LE.pack_into(full_message, 2, body_size)
+    full_message[4] = command
+    full_message[5:end] = payload
+    _U16BE.pack_into(
+        full_message, end, frame_checksum(memoryview(full_message)[2:end])
+    )
 
-    return frames
+    # Split into 63-byte chunks (first byte of each report is chunk
+    # length). A message that fits in one report comes out as a single
+    # chunk, byte-identical to build_frame(), with no second CRC pass.
+    # Each report is joined straight from a view of the message and the
+    # shared zero padding, with no per-report bytearray to stage first.
+    message = memoryview(full_message)
+    step = HID_REPORT_SIZE - 1
+    return [
+        b"".join((
+            _CHUNK_LENGTHS[len(chunk)],
+            chunk,
+            _REPORT_PADDING[: step - len(chunk)],
+        ))
+        for chunk in (
+            message[offset : offset + step]
+            for offset in range(0, len(message), step)
+        )
+    ]
 
 
-def parse_message(assembled: bytes) -> Frame | None:
+def parse_message(
+    assembled: bytes, expected: frozenset[int] | None = None
+) -> Frame | None:
     """Parse a fully assembled protocol message (preamble onward).
 
     Args:
         assembled: ``preamble + size + command + payload + checksum`` with
             any HID report framing (length prefixes, padding) already removed.
+            Any bytes-like object; it is read through a ``memoryview``, so
+            only the returned payload is copied.
+        expected: Optional set of command bytes the caller cares about.
+            Messages with any other command are rejected before the
+            checksum is computed.
 
     Returns:
-        A ``Frame`` if the preamble, length, and checksum are valid,
-        else ``None``.
+        A ``Frame`` if the preamble, length, and checksum are valid (and
+        the command is expected), else ``None``.
     """
     if len(assembled) < 7:
         return None
+    assembled = memoryview(assembled)
 
-    if assembled[0:2] != PREAMBLE:
+    if assembled[0] != _PRE0 or assembled[1] != _PRE1:
         return None
 
-    body_size = int.from_bytes(assembled[2:4], "little")
+    (body_size,) = _U16LE.unpack_from(assembled, 2)
     if body_size < 1:
         return None
 
@@ -146,14 +254,18 @@ def parse_message(assembled: bytes) -> Frame | None:
         return None
 
     command = assembled[4]
-    payload = assembled[5 : 4 + body_size]
+    if expected is not None and command not in expected:
+        return None
 
-    expected_checksum = int.from_bytes(
-        assembled[4 + body_size : 4 + body_size + 2], "big"
-    )
+    (expected_checksum,) = _U16BE.unpack_from(assembled, 4 + body_size)
     if frame_checksum(assembled[2 : 4 + body_size]) != expected_checksum:
         return None
 
+    # A view over immutable bytes is handed over as-is and copied only if
+    # the payload is read; views over mutable buffers are copied now.
+    payload = assembled[5 : 4 + body_size]
+    if not payload.readonly:
+        payload = bytes(payload)
     return Frame(command=command, payload=payload)
 
 
@@ -167,19 +279,21 @@ def message_total_size(header: bytes) -> int | None:
         Total message length in bytes (preamble + size + body + checksum),
         or ``None`` if the header is invalid.
     """
-    if len(header) < 4 or header[0:2] != PREAMBLE:
+    if len(header) < 4 or header[0] != _PRE0 or header[1] != _PRE1:
         return None
-    body_size = int.from_bytes(header[2:4], "little")
+    (body_size,) = _U16LE.unpack_from(header, 2)
     if body_size < 1:
         return None
     return 4 + body_size + 2
 
 
-def parse_frame(data: bytes) -> Frame | None:
+def parse_frame(data: bytes, expected: frozenset[int] | None = None) -> Frame | None:
     """Parse a 64-byte HID report into a Frame.
 
     Args:
         data: A 64-byte USB HID report.
+        expected: Optional set of command bytes to accept; see
+            :func:`parse_message`.
 
     Returns:
         A ``Frame`` if the report contains a complete valid protocol
@@ -193,24 +307,59 @@ def parse_frame(data: bytes) -> Frame | None:
     if hid_size < 7:
         return None
 
-    return parse_message(data[1 : 1 + hid_size])
+    return parse_message(memoryview(data)[1 : 1 + hid_size], expected)
 
 
-def parse_chunked_frames(reports: list[bytes]) -> Frame | None:
+def parse_chunked_frames(
+    reports: list[bytes], expected: frozenset[int] | None = None
+) -> Frame | None:
     """Reassemble a multi-report message and parse it.
 
+    The checksum is accumulated chunk by chunk as the reports are
+    walked, so the message is never joined into one buffer just to be
+    scanned again; only the payload is copied out.
+
     Args:
         reports: List of 64-byte HID reports forming a single message.
+        expected: Optional set of command bytes to accept; see
+            :func:`parse_message`.
 
     Returns:
         A ``Frame`` if reassembly and checksum pass, else ``None``.
     """
-    # Concatenate the meaningful bytes from each report
-    assembled = b""
-    for report in reports:
-        if len(report) < 1:
-            continue
-        chunk_size = report[0]
-        assembled += report[1 : 1 + chunk_size]
-
-    return parse_message(assembled)
+    chunks = [memoryview(report)[1 : 1 + report[0]] for report in reports if report]
+    if not chunks or len(chunks[0]) < 5:
+        # Header split across reports; not seen in practice
+        return parse_message(b"".join(chunks), expected)
+
+    total = message_total_size(chunks[0])
+    if total is None:
+        return None
+    command = chunks[0][4]
+    if expected is not None and command not in expected:
+        return None
+    crc_end = total - 2  # checksum covers size + command + payload
+
+    state = 0
+    payload_parts: list[memoryview] = []
+    checksum = bytearray()
+    pos = 0
+    for chunk in chunks:
+        stop = pos + len(chunk)
+        # Each chunk may hold part of the CRC range, the payload and the
+        # trailing checksum; take the overlapping piece of each.
+        if pos < crc_end and stop > 2:
+            state = crc16_update(
+                state, chunk[max(2 - pos, 0) : min(crc_end, stop) - pos]
+            )
+        if pos < crc_end and stop > 5:
+            payload_parts.append(chunk[max(5 - pos, 0) : min(crc_end, stop) - pos])
+        if stop > crc_end and pos < total:
+            checksum += chunk[max(crc_end - pos, 0) : min(total, stop) - pos]
+        pos = stop
+
+    if pos < total:
+        return None
+    if ~state & 0xFFFF != _U16BE.unpack(checksum)[0]:
+        return None
+    return Frame(command=command, payload=b"".join(payload_parts))
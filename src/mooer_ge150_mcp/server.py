@@ -6,9 +6,13 @@ using the official Python MCP SDK with stdio transport.
 
 from __future__ import annotations
 
+import functools
+import inspect
 import json
 import logging
+import os
 import time
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 
@@ -23,6 +27,7 @@ from .protocol.commands import (
     decode_active_state,
     decode_ir_list,
     decode_preset_record,
+    decode_record_name,
     build_dump_presets,
     build_hello,
     build_module_block,
@@ -66,6 +71,12 @@ from .protocol.commands import (
     build_command,
 )
 from .transport.usb_connection import USBConnection
+from .utils.crc import crc16
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "orjson" extra
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +85,9 @@ logger = logging.getLogger(__name__)
 #: watchdog-reboot in live testing (2026-07-26).
 WRITE_PACING_SECONDS = 0.02
 
+#: Log restore progress after every this many uploaded records.
+UPLOAD_PROGRESS_EVERY = 20
+
 #: File-format tags for backups and single-preset exports.
 BACKUP_FORMAT = "mooer-ge150-backup"
 PRESET_FORMAT = "mooer-ge150-preset"
@@ -96,6 +110,31 @@ def _get_connection() -> USBConnection:
     return _connection
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize a resource body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+#: Valid 0-based preset slots; ``in`` is a constant-time check.
+_SLOT_RANGE = range(200)
+
+
+def _validates_slot(fn):
+    """Reject an out-of-range ``slot`` argument before the tool runs."""
+    position = list(inspect.signature(fn).parameters).index("slot")
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        slot = kwargs["slot"] if "slot" in kwargs else args[position]
+        if slot not in _SLOT_RANGE:
+            return {"error": "Slot must be 0-199"}
+        return fn(*args, **kwargs)
+
+    return wrapper
+
+
 # ─── AMP / EFFECT CATALOGS ────────────────────────────────────────────
 
 AMP_MODELS = [
@@ -139,12 +178,111 @@ EFFECT_CATALOG = {
                "Ambient", "Church", "Arena"],
 }
 
+# The catalogs never change at runtime, so their resource bodies are
+# serialized once here rather than on every read.
+_AMP_CATALOG_JSON = _dumps({
+    "amps": [{"id": i, "name": name} for i, name in enumerate(AMP_MODELS)],
+    "count": len(AMP_MODELS),
+})
+_CAB_CATALOG_JSON = _dumps({
+    "cabs": [{"id": i, "name": name} for i, name in enumerate(CAB_MODELS)],
+    "count": len(CAB_MODELS),
+})
+_EFFECTS_CATALOG_JSON = _dumps({
+    "effects": {
+        category: [{"id": i, "name": name} for i, name in enumerate(effects)]
+        for category, effects in EFFECT_CATALOG.items()
+    },
+})
+_IR_SLOTS_JSON = _dumps({
+    "slots": [{"slot": i, "name": f"IR Slot {i + 1}"} for i in range(10)],
+})
+
 
 # ─── CAPTURE-DERIVED HELPERS ──────────────────────────────────────────
 
 #: Records from the last bulk dump, keyed by 0-199 server slot.
 _record_cache: dict[int, Any] = {}
 
+#: On-disk copy of the last bulk dump for the connected pedal, so a
+#: restarted server can list preset names without a dump. Presets can
+#: change on the pedal itself, so the copy is only ever shown, never
+#: merged into a write. Set by connect(); None (the default, and in
+#: tests) disables it.
+_record_cache_file: Path | None = None
+
+#: The disk copy once read, kept apart from _record_cache so that it can
+#: only reach _listed_records(). None until first needed.
+_disk_records: dict[int, Any] | None = None
+
+
+def _record_cache_path(vendor_id: int, product_id: int, serial: str = "") -> Path:
+    """Disk-cache location for one pedal.
+
+    The USB serial number, when the pedal reports one, keeps two units
+    of the same model apart. ``MOOER_GE150_CACHE_DIR`` overrides the
+    default ``~/.cache/mooer_ge150``.
+    """
+    base = os.environ.get("MOOER_GE150_CACHE_DIR")
+    root = Path(base) if base else Path.home() / ".cache" / "mooer_ge150"
+    name = f"records-{vendor_id:04x}-{product_id:04x}"
+    serial = "".join(c for c in serial if c.isalnum())
+    if serial:
+        name += f"-{serial}"
+    return root / f"{name}.bin"
+
+
+def _load_disk_records() -> dict[int, Any]:
+    """Read the persisted dump: raw records back to back, then a CRC-16.
+
+    A missing, truncated or corrupt file reads as empty.
+    """
+    if _record_cache_file is None:
+        return {}
+    try:
+        data = _record_cache_file.read_bytes()
+    except OSError:
+        return {}
+    body = memoryview(data)[:-2]
+    if (
+        len(data) < 2
+        or len(body) % PRESET_RECORD_SIZE
+        or crc16(body) != int.from_bytes(data[-2:], "big")
+    ):
+        logger.debug("Ignoring unusable record cache %s", _record_cache_file)
+        return {}
+    records: dict[int, Any] = {}
+    for offset in range(0, len(body), PRESET_RECORD_SIZE):
+        try:
+            record = decode_preset_record(data[offset : offset + PRESET_RECORD_SIZE])
+        except ValueError:
+            return {}
+        records[record.slot - FIRST_PRESET_SLOT] = record
+    return records
+
+
+def _save_disk_records(records: dict[int, Any]) -> None:
+    """Persist a dump; failures only cost the next cold read."""
+    if _record_cache_file is None:
+        return
+    body = b"".join(
+        encode_preset_record(record) for _, record in sorted(records.items())
+    )
+    try:
+        _record_cache_file.parent.mkdir(parents=True, exist_ok=True)
+        _record_cache_file.write_bytes(body + crc16(body).to_bytes(2, "big"))
+    except OSError as exc:
+        logger.debug("Could not write record cache: %s", exc)
+
+
+def _invalidate_records() -> None:
+    """Forget cached records after the pedal's presets have changed."""
+    global _disk_records
+    _record_cache.clear()
+    _disk_records = None
+    if _record_cache_file is not None:
+        _record_cache_file.unlink(missing_ok=True)
+
 
 def _fetch_all_records(refresh: bool = True) -> dict[int, Any]:
     """Pull every preset via the bulk dump, keyed by 0-199 server slot.
@@ -152,7 +290,8 @@ def _fetch_all_records(refresh: bool = True) -> dict[int, Any]:
     The pedal answers DUMP_PRESETS with one record per slot -- there is
     no confirmed way to read a single preset, so reading one means
     reading all of them. Results are cached; pass ``refresh=False`` to
-    reuse the previous dump.
+    reuse the previous dump from this process. The disk copy is never
+    used here (see :func:`_listed_records`).
     """
     global _record_cache
     if _record_cache and not refresh:
@@ -175,8 +314,9 @@ def _fetch_all_records(refresh: bool = True) -> dict[int, Any]:
         )
 
     records: dict[int, Any] = {}
+    record_command = int(Command.PRESET_RECORD)
     for frame in frames:
-        if frame.command != Command.PRESET_RECORD:
+        if frame.command != record_command:
             continue
         try:
             record = decode_preset_record(frame.payload)
@@ -187,24 +327,41 @@ def _fetch_all_records(refresh: bool = True) -> dict[int, Any]:
 
     if records:
         _record_cache = records
+        _save_disk_records(records)
     return records
 
 
+def _listed_records() -> dict[int, Any]:
+    """Records for read-only listing: this process's last dump, or after
+    a restart the one persisted to disk. Never use these for a write."""
+    global _disk_records
+    if _record_cache:
+        return _record_cache
+    if _disk_records is None:
+        _disk_records = _load_disk_records()
+    return _disk_records
+
+
+#: Module command -> user-facing module name, and the chain in that form.
+_MODULE_NAMES = {command: name for name, command in MODULE_COMMAND_MAP.items()}
+_NAMED_CHAIN = tuple((command, _MODULE_NAMES[command]) for command in MODULE_CHAIN)
+
+
 def _record_to_dict(record: Any) -> dict[str, Any]:
     """Render a PresetRecord as JSON-friendly output."""
-    names = {command: name for name, command in MODULE_COMMAND_MAP.items()}
+    modules: dict[str, Any] = {}
+    for command, name in _NAMED_CHAIN:
+        block = record.modules[command]
+        modules[name] = {
+            "enabled": block.enabled,
+            "effect_type": block.effect_type,
+            "params": block.params,
+        }
     return {
         "slot": record.slot - FIRST_PRESET_SLOT,
         "address": slot_to_address(record.slot),
         "name": record.name,
-        "modules": {
-            names[command]: {
-                "enabled": record.modules[command].enabled,
-                "effect_type": record.modules[command].effect_type,
-                "params": record.modules[command].params,
-            }
-            for command in MODULE_CHAIN
-        },
+        "modules": modules,
     }
 
 
@@ -228,13 +385,16 @@ def _upload_records(conn, records: list) -> int:
     number of records the pedal acknowledged.
     """
     acked = 0
+    total = len(records)
     conn.write(build_restore_begin())
     time.sleep(WRITE_PACING_SECONDS)
     try:
-        for record in records:
-            for report in build_write_preset_record(record):
-                conn.write(report)
-                time.sleep(WRITE_PACING_SECONDS)
+        for index, record in enumerate(records, 1):
+            conn.send_chunked(
+                build_write_preset_record(record), WRITE_PACING_SECONDS
+            )
+            time.sleep(WRITE_PACING_SECONDS)
+            # Only the ack is read back; the upload itself is write-only.
             for _ in range(8):
                 ack = conn.read_message()
                 if ack is None:
@@ -242,12 +402,19 @@ def _upload_records(conn, records: list) -> int:
                 if ack.command == Command.WRITE_PRESET_ACK:
                     acked += 1
                     break
+            # A full restore takes tens of seconds at the required pacing;
+            # report progress so a long one is visibly alive.
+            if index % UPLOAD_PROGRESS_EVERY == 0 or index == total:
+                logger.info(
+                    "Uploaded %d of %d preset records (%d acknowledged)",
+                    index, total, acked,
+                )
             # The editor paces successive records ~100 ms apart; sending
             # them back-to-back rebooted the pedal in live testing.
             time.sleep(0.1)
     finally:
         conn.write(build_restore_end())
-    _record_cache.clear()
+    _invalidate_records()
     return acked
 
 
@@ -279,7 +446,7 @@ def _write_record_live(conn, slot: int, record) -> bool:
     # made on the pedal itself), so this is fire-and-forget plus pacing.
     conn.write(build_save_preset(slot, record.name))
     time.sleep(0.15)
-    _record_cache.clear()
+    _invalidate_records()
     return True
 
 
@@ -319,6 +486,30 @@ def _merge_module_states(
     return None
 
 
+def _blank_record(slot: int):
+    """A PresetRecord for *slot* (0-199) with every module off."""
+    record = PresetRecord(slot=slot + FIRST_PRESET_SLOT)
+    for command in MODULE_CHAIN:
+        record.modules[command] = ModuleBlock(enabled=False, effect_type=0)
+    return record
+
+
+def _is_full_preset_spec(
+    name: str | None, modules: dict[str, dict[str, Any]] | None
+) -> bool:
+    """True when *name* and *modules* pin down every module completely,
+    so merging over the slot's current record could not change anything."""
+    if name is None or not modules:
+        return False
+    covered = set()
+    for module_name, state in modules.items():
+        if not {"enabled", "effect_type", "params"} <= set(state):
+            return False
+        key = module_name.lower()
+        covered.add(MODULE_NAME_ALIASES.get(key, key))
+    return covered >= MODULE_COMMAND_MAP.keys()
+
+
 def _record_to_file_entry(record) -> dict[str, Any]:
     """A JSON-safe preset entry carrying the byte-exact record."""
     return {
@@ -329,17 +520,23 @@ def _record_to_file_entry(record) -> dict[str, Any]:
     }
 
 
-def _record_from_file_entry(entry: dict[str, Any], slot: int):
-    """Rebuild a PresetRecord from a file entry, re-slotted to *slot*
-    (0-199). Raises ValueError on malformed input."""
-    raw = bytearray(bytes.fromhex(str(entry["record"])))
+def _file_entry_payload(entry: dict[str, Any], slot: int) -> bytes:
+    """Raw record payload of a file entry, re-slotted to *slot* (0-199).
+    Raises ValueError on malformed input."""
+    raw = bytearray.fromhex(str(entry["record"]))
     if len(raw) != PRESET_RECORD_SIZE:
         raise ValueError(
             f"Preset record must be {PRESET_RECORD_SIZE} bytes, "
             f"got {len(raw)}"
         )
     raw[0] = slot + FIRST_PRESET_SLOT
-    return decode_preset_record(bytes(raw))
+    return bytes(raw)
+
+
+def _record_from_file_entry(entry: dict[str, Any], slot: int):
+    """Rebuild a PresetRecord from a file entry, re-slotted to *slot*
+    (0-199). Raises ValueError on malformed input."""
+    return decode_preset_record(_file_entry_payload(entry, slot))
 
 
 # ─── CONNECTION TOOLS ─────────────────────────────────────────────────
@@ -352,7 +549,7 @@ def connect() -> dict[str, Any]:
     handshake MOOER Studio uses: a hello, then a read of the active
     preset. Model and manufacturer come from the USB descriptors.
     """
-    global _connection
+    global _connection, _record_cache_file, _disk_records
     if _connection is not None and _connection.connected:
         return {
             "connected": True,
@@ -372,6 +569,10 @@ def connect() -> dict[str, Any]:
         "model": info.product,
         "manufacturer": info.manufacturer,
     }
+    _record_cache_file = _record_cache_path(
+        info.vendor_id, info.product_id, info.serial
+    )
+    _disk_records = None
 
     # Hello draws no reply; the active-preset read is what confirms the
     # pedal is actually talking to us.
@@ -391,12 +592,21 @@ def connect() -> dict[str, Any]:
 
 @mcp.tool()
 def disconnect() -> dict[str, bool]:
-    """Close the USB connection to the pedal."""
-    global _connection
+    """Close the USB connection to the pedal.
+
+    Cached records belong to the pedal they were read from, so they are
+    dropped from memory here; the on-disk copy stays for the next session.
+    """
+    global _connection, _record_cache, _record_cache_file, _disk_records
     if _connection is None:
         return {"disconnected": True}
-    _connection.close()
-    _connection = None
+    try:
+        _connection.close()
+    finally:
+        _connection = None
+        _record_cache = {}
+        _record_cache_file = None
+        _disk_records = None
     return {"disconnected": True}
 
 
@@ -465,15 +675,13 @@ def list_presets(start: int = 0, end: int = 199) -> dict[str, Any]:
 
 
 @mcp.tool()
+@_validates_slot
 def get_preset(slot: int) -> dict[str, Any]:
     """Read the full preset data for a specific slot.
 
     Args:
         slot: Preset index (0-199).
     """
-    if not 0 <= slot <= 199:
-        return {"error": "Slot must be 0-199"}
-
     records = _fetch_all_records()
     record = records.get(slot)
     if record is None:
@@ -483,16 +691,45 @@ def get_preset(slot: int) -> dict[str, Any]:
 
 
 @mcp.tool()
+def get_presets(slots: list[int]) -> dict[str, Any]:
+    """Read the full preset data for several slots in one call.
+
+    All slots come from a single bulk dump, so this costs the same as
+    one get_preset.
+
+    Args:
+        slots: Preset indices (0-199); duplicates are ignored.
+    """
+    wanted = sorted(set(slots))
+    if not wanted:
+        return {"error": "No slots given"}
+    if wanted[0] < 0 or wanted[-1] > 199:
+        return {"error": "Slots must be 0-199"}
+
+    records = _fetch_all_records()
+    presets = [_record_to_dict(records[s]) for s in wanted if s in records]
+    result: dict[str, Any] = {"presets": presets}
+    missing = [s for s in wanted if s not in records]
+    if missing:
+        result["missing_slots"] = missing
+    return result
+
+
+@mcp.tool()
+@_validates_slot
 def set_preset(
     slot: int,
     name: str | None = None,
     effects: dict[str, dict[str, Any]] | None = None,
+    merge: bool = True,
 ) -> dict[str, Any]:
     """Update a preset in place: merge changes over what the slot holds.
 
     Reads the slot's current record (via the bulk dump), applies the
     given name and module overrides, and writes the merged record back
-    with the confirmed direct-write command (0xC3).
+    with the confirmed direct-write command (0xC3). When the name and
+    every module's enabled / effect_type / params are all given there
+    is nothing to merge, and the read is skipped.
 
     Args:
         slot: Target slot (0-199).
@@ -500,17 +737,15 @@ def set_preset(
         effects: Optional per-module overrides using the same shape
             get_preset returns, e.g.
             ``{"amp": {"enabled": true, "effect_type": 5, "params": [90]}}``.
+        merge: Set False to start from a blank preset instead of the
+            slot's current contents.
     """
-    if not 0 <= slot <= 199:
-        return {"error": "Slot must be 0-199"}
-
     conn = _get_connection()
-    records = _fetch_all_records(refresh=False)
-    record = records.get(slot)
+    record = None
+    if merge and not _is_full_preset_spec(name, effects):
+        record = _fetch_all_records(refresh=False).get(slot)
     if record is None:
-        record = PresetRecord(slot=slot + FIRST_PRESET_SLOT)
-        for command in MODULE_CHAIN:
-            record.modules[command] = ModuleBlock(enabled=False, effect_type=0)
+        record = _blank_record(slot)
 
     error = _merge_module_states(record, effects or {})
     if error:
@@ -528,15 +763,64 @@ def set_preset(
 
 
 @mcp.tool()
+def set_presets(presets: dict[int, dict[str, Any]]) -> dict[str, Any]:
+    """Update several presets in one call, merging like set_preset.
+
+    The slots' current records are read once for the whole batch; each
+    slot is then written through the same live path as set_preset.
+
+    Args:
+        presets: Slot (0-199) to changes, each with an optional ``name``
+            and ``effects`` shaped as set_preset takes them, e.g.
+            ``{"3": {"name": "Lead", "effects": {"amp": {"params": [90]}}}}``.
+    """
+    changes = {int(slot): spec for slot, spec in presets.items()}
+    if not changes:
+        return {"error": "No presets given"}
+    if not all(0 <= slot <= 199 for slot in changes):
+        return {"error": "Slots must be 0-199"}
+
+    conn = _get_connection()
+    current = _fetch_all_records(refresh=False)
+
+    # Merge everything before the first write, so a bad entry leaves the
+    # pedal untouched.
+    merged = []
+    for slot, spec in sorted(changes.items()):
+        record = current.get(slot)
+        if record is None:
+            record = _blank_record(slot)
+        else:
+            # Merge into a copy; the cached record stays as dumped
+            record = replace(record, modules=dict(record.modules))
+        error = _merge_module_states(record, spec.get("effects") or {})
+        if error:
+            return {"error": f"Slot {slot}: {error}"}
+        if spec.get("name") is not None:
+            record = record.with_name(str(spec["name"]))
+        merged.append((slot, record))
+
+    written = []
+    for slot, record in merged:
+        stored = _write_record_live(conn, slot + FIRST_PRESET_SLOT, record)
+        written.append({
+            "slot": slot,
+            "address": slot_to_address(slot + FIRST_PRESET_SLOT),
+            "name": record.name,
+            "stored": stored,
+        })
+        time.sleep(0.2)
+    return {"presets": written}
+
+
+@mcp.tool()
+@_validates_slot
 def select_preset(slot: int) -> dict[str, Any]:
     """Switch the pedal's active preset.
 
     Args:
         slot: Preset index (0-199).
     """
-    if not 0 <= slot <= 199:
-        return {"error": "Slot must be 0-199"}
-
     # The wire slot is 1-based; the previous implementation sent the
     # 0-based index and selected the preset one below the one asked for.
     _get_connection().write(build_select_preset_slot(slot + FIRST_PRESET_SLOT))
@@ -569,7 +853,7 @@ def copy_preset(from_slot: int, to_slot: int) -> dict[str, Any]:
     time.sleep(0.1)
     conn.write(build_save_preset(to_slot + FIRST_PRESET_SLOT, source.name))
     time.sleep(0.15)
-    _record_cache.clear()
+    _invalidate_records()
     return {
         "copied": True,
         "from": from_slot,
@@ -601,8 +885,46 @@ def swap_presets(slot_a: int, slot_b: int) -> dict[str, Any]:
     return {"swapped": ok_a and ok_b, "slot_a": slot_a, "slot_b": slot_b}
 
 
+@mcp.tool()
+def clear_cache() -> dict[str, Any]:
+    """Forget cached preset records, in memory and on disk.
+
+    Use after editing presets on the pedal itself; the next cached read
+    dumps fresh records from the device.
+    """
+    dropped = len(_record_cache)
+    _invalidate_records()
+    return {"cleared": True, "records": dropped}
+
+
 # ─── EFFECT PARAMETER TOOLS ──────────────────────────────────────────
 
+def _resolve_module_command(module: str) -> tuple[Any, str | None]:
+    """Map a module name or alias to its command.
+
+    Returns ``(command, None)``, or ``(None, error message)`` when the
+    module is unknown.
+    """
+    key = MODULE_NAME_ALIASES.get(module.lower(), module.lower())
+    if key not in MODULE_COMMAND_MAP:
+        return None, (
+            f"Unknown module '{module}'. Valid: {list(MODULE_COMMAND_MAP)}"
+        )
+    return MODULE_COMMAND_MAP[key], None
+
+
+def _param_error(param_index: int, value: int) -> str | None:
+    """Validate one parameter write; returns an error message or None."""
+    if not 0 <= param_index < MAX_MODULE_PARAMS:
+        return (
+            f"param_index must be 0-{MAX_MODULE_PARAMS - 1}, "
+            f"got {param_index}"
+        )
+    if not 0 <= value <= 0xFFFF:
+        return f"Value must be 0-65535, got {value}"
+    return None
+
+
 @mcp.tool()
 def set_effect_param(
     module: str,
@@ -620,22 +942,13 @@ def set_effect_param(
         param_index: Position of the parameter within the module, 0-9.
         value: Parameter value, 0-65535.
     """
-    try:
-        command = MODULE_COMMAND_MAP[
-            MODULE_NAME_ALIASES.get(module.lower(), module.lower())
-        ]
-    except KeyError:
-        return {
-            "error": f"Unknown module '{module}'. Valid: {list(MODULE_COMMAND_MAP)}"
-        }
+    command, error = _resolve_module_command(module)
+    if error:
+        return {"error": error}
 
-    if not 0 <= param_index < MAX_MODULE_PARAMS:
-        return {
-            "error": f"param_index must be 0-{MAX_MODULE_PARAMS - 1}, "
-                     f"got {param_index}"
-        }
-    if not 0 <= value <= 0xFFFF:
-        return {"error": f"Value must be 0-65535, got {value}"}
+    error = _param_error(param_index, value)
+    if error:
+        return {"error": error}
 
     modules = _read_active_modules()
     if modules is None:
@@ -659,6 +972,53 @@ def set_effect_param(
     }
 
 
+@mcp.tool()
+def set_effect_params(module: str, values: dict[int, int]) -> dict[str, Any]:
+    """Modify several parameters of one module on the active preset at once.
+
+    The batch form of set_effect_param: the module's block is read once
+    and written once with every change applied, instead of one read and
+    one write per parameter.
+
+    Args:
+        module: Effect module (fx, ds, amp, cab, ns, eq, mod, delay, reverb).
+        values: Parameter position (0-9) to value (0-65535), e.g.
+            ``{"0": 90, "2": 40}``.
+    """
+    command, error = _resolve_module_command(module)
+    if error:
+        return {"error": error}
+
+    if not values:
+        return {"error": "No parameter values given"}
+    updates = {int(index): value for index, value in values.items()}
+    for index, value in updates.items():
+        error = _param_error(index, value)
+        if error:
+            return {"error": error}
+
+    modules = _read_active_modules()
+    if modules is None:
+        return {"error": "Could not read the active preset from the device"}
+
+    block = modules[command]
+    params = list(block.params)
+    params += [0] * (MAX_MODULE_PARAMS - len(params))
+    for index, value in updates.items():
+        params[index] = value
+    updated = ModuleBlock(
+        enabled=block.enabled, effect_type=block.effect_type, params=params
+    )
+
+    _get_connection().write(build_module_block(module, updated))
+    return {
+        "module": module,
+        "params": updated.params,
+        "effect_type": updated.effect_type,
+        "enabled": updated.enabled,
+    }
+
+
 @mcp.tool()
 def toggle_effect(module: str, enabled: bool) -> dict[str, Any]:
     """Turn an effect module on or off on the currently active preset.
@@ -801,7 +1161,9 @@ def backup_all(output_path: str) -> dict[str, Any]:
         ],
     }
     path = Path(output_path)
-    path.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+    # Encoded straight into the file, never as one document-sized string
+    with path.open("w", encoding="utf-8") as fh:
+        json.dump(payload, fh, indent=1)
 
     result: dict[str, Any] = {
         "path": str(path),
@@ -838,7 +1200,8 @@ def restore_backup(input_path: str, overwrite: bool = False) -> dict[str, Any]:
         return {"error": f"File not found: {input_path}"}
 
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        with path.open(encoding="utf-8") as fh:
+            payload = json.load(fh)
     except (OSError, json.JSONDecodeError) as exc:
         return {"error": f"Could not read backup file: {exc}"}
     if payload.get("format") != BACKUP_FORMAT:
@@ -855,21 +1218,23 @@ def restore_backup(input_path: str, overwrite: bool = False) -> dict[str, Any]:
     for entry in payload.get("presets", []):
         try:
             slot = int(entry["slot"])
-            record = _record_from_file_entry(entry, slot)
+            raw = _file_entry_payload(entry, slot)
         except (KeyError, TypeError, ValueError) as exc:
             return {"error": f"Malformed backup entry: {exc}"}
         if not 0 <= slot <= 199:
             return {"error": f"Backup entry has bad slot {slot}"}
 
+        # Skipped entries are judged on their name alone; only records
+        # that will actually be written are decoded in full.
         existing = device.get(slot)
         occupied = existing is not None and existing.name.strip()
-        if occupied and not record.name.strip():
+        if occupied and not decode_record_name(raw).strip():
             skipped.append(slot)  # never erase a named preset with an empty one
             continue
         if occupied and not overwrite:
             skipped.append(slot)
             continue
-        to_write.append(record)
+        to_write.append(decode_preset_record(raw))
 
     acked = _upload_records(conn, to_write) if to_write else 0
     # RESTORE_END reboots the pedal by design; ride through it.
@@ -889,6 +1254,7 @@ def restore_backup(input_path: str, overwrite: bool = False) -> dict[str, Any]:
 
 
 @mcp.tool()
+@_validates_slot
 def export_preset(slot: int, output_path: str) -> dict[str, Any]:
     """Export a single preset to a JSON file.
 
@@ -896,9 +1262,6 @@ def export_preset(slot: int, output_path: str) -> dict[str, Any]:
         slot: Preset slot (0-199).
         output_path: Output file path.
     """
-    if not 0 <= slot <= 199:
-        return {"error": "Slot must be 0-199"}
-
     records = _fetch_all_records(refresh=False)
     record = records.get(slot)
     if record is None:
@@ -913,6 +1276,7 @@ def export_preset(slot: int, output_path: str) -> dict[str, Any]:
 
 
 @mcp.tool()
+@_validates_slot
 def import_preset(input_path: str, slot: int) -> dict[str, Any]:
     """Import a preset from a file written by export_preset.
 
@@ -920,8 +1284,6 @@ def import_preset(input_path: str, slot: int) -> dict[str, Any]:
         input_path: Path to the preset JSON file.
         slot: Target slot (0-199).
     """
-    if not 0 <= slot <= 199:
-        return {"error": "Slot must be 0-199"}
     path = Path(input_path)
     if not path.exists():
         return {"error": f"File not found: {input_path}"}
@@ -1063,15 +1425,13 @@ def upload_amp(index: int, name: str, blob_hex: str) -> dict[str, Any]:
 # ─── CAPTURE-DERIVED WRITE TOOLS ──────────────────────────────────────
 
 @mcp.tool()
+@_validates_slot
 def select_preset_slot(slot: int) -> dict[str, Any]:
     """Make a preset active on the pedal.
 
     Args:
         slot: Preset slot 0-199.
     """
-    if not 0 <= slot <= 199:
-        return {"error": "Slot must be 0-199"}
-
     _get_connection().write(build_select_preset_slot(slot + FIRST_PRESET_SLOT))
     return {
         "slot": slot,
@@ -1081,6 +1441,7 @@ def select_preset_slot(slot: int) -> dict[str, Any]:
 
 
 @mcp.tool()
+@_validates_slot
 def save_preset(slot: int, name: str) -> dict[str, Any]:
     """Commit the pedal's current live state to a preset slot.
 
@@ -1091,11 +1452,8 @@ def save_preset(slot: int, name: str) -> dict[str, Any]:
         slot: Target preset slot 0-199.
         name: Preset name, up to 16 ASCII characters.
     """
-    if not 0 <= slot <= 199:
-        return {"error": "Slot must be 0-199"}
-
     _get_connection().write(build_save_preset(slot + FIRST_PRESET_SLOT, name))
-    _record_cache.clear()
+    _invalidate_records()
     return {
         "slot": slot,
         "address": slot_to_address(slot + FIRST_PRESET_SLOT),
@@ -1105,6 +1463,7 @@ def save_preset(slot: int, name: str) -> dict[str, Any]:
 
 
 @mcp.tool()
+@_validates_slot
 def write_preset(
     slot: int,
     name: str,
@@ -1121,9 +1480,6 @@ def write_preset(
         modules: Per-module state, e.g.
             {"amp": {"enabled": true, "effect_type": 16, "params": [37, 50]}}.
     """
-    if not 0 <= slot <= 199:
-        return {"error": "Slot must be 0-199"}
-
     blocks: dict[Any, Any] = {}
     for module_name, state in (modules or {}).items():
         key = MODULE_NAME_ALIASES.get(module_name.lower(), module_name.lower())
@@ -1151,7 +1507,7 @@ def write_preset(
         conn.write(report)
         time.sleep(WRITE_PACING_SECONDS)
 
-    _record_cache.clear()
+    _invalidate_records()
     return {
         "slot": slot,
         "address": slot_to_address(slot + FIRST_PRESET_SLOT),
@@ -1285,15 +1641,13 @@ def set_global_eq(
 # ─── CTRL CONFIGURATION ───────────────────────────────────────────────
 
 @mcp.tool()
+@_validates_slot
 def get_ctrl_config(slot: int) -> dict[str, Any]:
     """Read which modules a preset's footswitch toggles (its CTRL setup).
 
     Args:
         slot: Preset slot 0-199.
     """
-    if not 0 <= slot <= 199:
-        return {"error": "Slot must be 0-199"}
-
     conn = _get_connection()
     response = conn.send_and_expect(
         build_read_ctrl_config(slot), Command.CTRL_CONFIG
@@ -1302,15 +1656,15 @@ def get_ctrl_config(slot: int) -> dict[str, Any]:
         return {"error": "No CTRL config reply from device"}
 
     _, flags = decode_ctrl_config(response.payload)
-    names = {command: name for name, command in MODULE_COMMAND_MAP.items()}
     return {
         "slot": slot,
         "address": slot_to_address(slot + FIRST_PRESET_SLOT),
-        "toggles": {names[c]: v for c, v in flags.items()},
+        "toggles": {_MODULE_NAMES[c]: v for c, v in flags.items()},
     }
 
 
 @mcp.tool()
+@_validates_slot
 def set_ctrl_config(slot: int, modules: list[str]) -> dict[str, Any]:
     """Choose which modules a preset's footswitch toggles.
 
@@ -1319,9 +1673,6 @@ def set_ctrl_config(slot: int, modules: list[str]) -> dict[str, Any]:
         modules: Module names the footswitch should toggle, e.g.
             ["delay", "reverb"]. Any not listed are left untouched by it.
     """
-    if not 0 <= slot <= 199:
-        return {"error": "Slot must be 0-199"}
-
     wanted = set()
     for name in modules:
         key = MODULE_NAME_ALIASES.get(name.lower(), name.lower())
@@ -1340,6 +1691,7 @@ def set_ctrl_config(slot: int, modules: list[str]) -> dict[str, Any]:
 # ─── DIRECT PRESET WRITE ──────────────────────────────────────────────
 
 @mcp.tool()
+@_validates_slot
 def put_preset(slot: int, preset: dict[str, Any]) -> dict[str, Any]:
     """Write a complete preset record directly to a slot.
 
@@ -1355,11 +1707,7 @@ def put_preset(slot: int, preset: dict[str, Any]) -> dict[str, Any]:
         preset: A preset as returned by get_preset -- ``name`` plus
             ``modules``, each with enabled / effect_type / params.
     """
-    if not 0 <= slot <= 199:
-        return {"error": "Slot must be 0-199"}
-
-    record = PresetRecord(slot=slot + FIRST_PRESET_SLOT)
-    record = record.with_name(str(preset.get("name", "")))
+    record = _blank_record(slot).with_name(str(preset.get("name", "")))
 
     blocks: dict[Any, Any] = {}
     for name, state in (preset.get("modules") or {}).items():
@@ -1375,9 +1723,7 @@ def put_preset(slot: int, preset: dict[str, Any]) -> dict[str, Any]:
         except (TypeError, ValueError) as exc:
             return {"error": f"Bad state for module '{name}': {exc}"}
 
-    for command in MODULE_CHAIN:
-        blocks.setdefault(command, ModuleBlock(enabled=False, effect_type=0))
-    record.modules = blocks
+    record.modules.update(blocks)
 
     conn = _get_connection()
     acked = _upload_records(conn, [record])
@@ -1397,10 +1743,10 @@ def put_preset(slot: int, preset: dict[str, Any]) -> dict[str, Any]:
 def resource_device_info() -> str:
     """Device model, firmware, connection state."""
     if _connection is None or not _connection.connected:
-        return json.dumps({"connected": False})
+        return _dumps({"connected": False})
 
     info = _connection.device_info
-    return json.dumps({
+    return _dumps({
         "connected": True,
         "manufacturer": info.manufacturer,
         "product": info.product,
@@ -1413,71 +1759,81 @@ def resource_device_info() -> str:
 def resource_device_status() -> str:
     """Connection state and active preset."""
     connected = _connection is not None and _connection.connected
-    return json.dumps({"connected": connected})
+    return _dumps({"connected": connected})
+
+
+#: (cache dict, its size, rendered JSON) for the presets-list resource.
+#: A new dump replaces the dict and invalidation empties it, so either
+#: change is seen without hooks in every writer.
+_presets_list_memo: tuple[dict[int, Any], int, str] | None = None
 
 
 @mcp.resource("mooer://presets/list")
 def resource_presets_list() -> str:
     """Summary list of preset names from the last bulk dump."""
+    global _presets_list_memo
+    records = _listed_records()
+    memo = _presets_list_memo
+    if (
+        memo is not None
+        and memo[0] is records
+        and memo[1] == len(records)
+    ):
+        return memo[2]
+
     presets = [
         {
             "slot": slot,
             "address": slot_to_address(record.slot),
             "name": record.name,
         }
-        for slot, record in sorted(_record_cache.items())
+        for slot, record in sorted(records.items())
     ]
-    return json.dumps({"presets": presets})
+    body = _dumps({"presets": presets})
+    _presets_list_memo = (records, len(records), body)
+    return body
 
 
 @mcp.resource("mooer://catalog/amps")
 def resource_amp_catalog() -> str:
     """List of all amp model names with IDs."""
-    amps = [{"id": i, "name": name} for i, name in enumerate(AMP_MODELS)]
-    return json.dumps({"amps": amps, "count": len(amps)})
+    return _AMP_CATALOG_JSON
 
 
 @mcp.resource("mooer://catalog/cabs")
 def resource_cab_catalog() -> str:
     """List of all cabinet simulation names with IDs."""
-    cabs = [{"id": i, "name": name} for i, name in enumerate(CAB_MODELS)]
-    return json.dumps({"cabs": cabs, "count": len(cabs)})
+    return _CAB_CATALOG_JSON
 
 
 @mcp.resource("mooer://catalog/effects")
 def resource_effects_catalog() -> str:
     """List of all effects organized by category."""
-    catalog = {}
-    for category, effects in EFFECT_CATALOG.items():
-        catalog[category] = [
-            {"id": i, "name": name} for i, name in enumerate(effects)
-        ]
-    return json.dumps({"effects": catalog})
+    return _EFFECTS_CATALOG_JSON
 
 
 @mcp.resource("mooer://catalog/ir-slots")
 def resource_ir_slots() -> str:
     """User IR slot status."""
-    slots = [{"slot": i, "name": f"IR Slot {i + 1}"} for i in range(10)]
-    return json.dumps({"slots": slots})
+    return _IR_SLOTS_JSON
 
 
 @mcp.resource("mooer://system/settings")
 def resource_system_settings() -> str:
     """Global system settings (cached)."""
-    return json.dumps({"settings": {}})
+    return _dumps({"settings": {}})
 
 
 @mcp.resource("mooer://system/footswitch")
 def resource_footswitch() -> str:
     """Footswitch assignments."""
-    return json.dumps({"footswitch": {}})
+    return _dumps({"footswitch": {}})
 
 
 @mcp.resource("mooer://system/pedal-assign")
 def resource_pedal_assign() -> str:
     """Expression pedal assignments."""
-    return json.dumps({"pedal_assign": {}})
+    return _dumps({"pedal_assign": {}})
 
 
 # ─── MCP PROMPTS ─────────────────────────────────────────────────────
@@ -9,6 +9,7 @@ descriptor in ``log/various_tests.pcapng`` places at interface 5 with
 
 from __future__ import annotations
 
+import array
 import logging
 import time
 from dataclasses import dataclass, field
@@ -44,6 +45,15 @@ class DeviceInfo:
     manufacturer: str = ""
     product: str = ""
     path: str = ""
+    serial: str = ""
+
+
+def _hid_serial(device) -> str:
+    """The device's USB serial number, or "" if it does not report one."""
+    try:
+        return device.get_serial_number_string() or ""
+    except Exception:
+        return ""
 
 
 class USBConnection:
@@ -67,8 +77,24 @@ class USBConnection:
         self._product_id = product_id
         self._device = None
         self._backend: str = ""
+        # usb.util as imported by _open_pyusb, kept for close()
+        self._usb_util = None
         self._connected = False
         self._device_info = DeviceInfo(vendor_id=vendor_id, product_id=product_id)
+        # hidapi output buffer: report ID 0x00 followed by the 64-byte
+        # report. cython-hidapi still copies whatever it is given, so
+        # this only saves building a new prefixed bytes object per write.
+        self._tx_buffer = bytearray(1 + HID_REPORT_SIZE)
+        # pyusb turns anything but an array('B') into a new array on every
+        # write; handing it this one, refilled in place, skips that copy.
+        self._usb_tx_buffer = array.array("B", bytes(HID_REPORT_SIZE))
+        # pyusb reads into a caller's array in place of allocating one.
+        self._usb_rx_buffer = array.array("B", bytes(HID_REPORT_SIZE))
+        # Last single-report message and its Frame. The pedal repeats
+        # identical notifications (expression position, module echoes),
+        # and a Frame is immutable, so a repeat can reuse the parse.
+        self._last_message: bytes | None = None
+        self._last_frame: Frame | None = None
 
     @property
     def connected(self) -> bool:
@@ -120,6 +146,7 @@ class USBConnection:
             product_id=self._product_id,
             manufacturer=getattr(info, 'manufacturer_string', '') or device.get_manufacturer_string() or '',
             product=getattr(info, 'product_string', '') or device.get_product_string() or '',
+            serial=getattr(info, 'serial_number', '') or _hid_serial(device),
         )
 
         logger.info(
@@ -145,6 +172,7 @@ class USBConnection:
         usb.util.claim_interface(dev, HID_INTERFACE)
 
         self._device = dev
+        self._usb_util = usb.util
         self._backend = "pyusb"
         self._connected = True
         self._device_info = DeviceInfo(
@@ -152,6 +180,10 @@ class USBConnection:
             product_id=self._product_id,
             manufacturer=usb.util.get_string(dev, dev.iManufacturer) or "",
             product=usb.util.get_string(dev, dev.iProduct) or "",
+            serial=(
+                usb.util.get_string(dev, dev.iSerialNumber) or ""
+                if dev.iSerialNumber else ""
+            ),
         )
 
         logger.info(
@@ -170,8 +202,11 @@ class USBConnection:
             if self._backend == "hidapi":
                 self._device.close()
             elif self._backend == "pyusb":
-                import usb.util
-                usb.util.release_interface(self._device, HID_INTERFACE)
+                usb_util = self._usb_util
+                usb_util.release_interface(self._device, HID_INTERFACE)
+                # Free the libusb handle now rather than at garbage
+                # collection, so a quick reconnect finds the device idle.
+                usb_util.dispose_resources(self._device)
         except Exception as e:
             logger.warning("Error closing device: %s", e)
         finally:
@@ -250,9 +285,13 @@ class USBConnection:
             # be 0x00. Without it the pedal receives reports with the
             # HID-size byte consumed as a report ID and ignores
             # everything (verified against real hardware).
-            return self._device.write(b"\x00" + data)
+            tx = self._tx_buffer
+            tx[1:] = data
+            return self._device.write(tx)
         elif self._backend == "pyusb":
-            return self._device.write(EP_OUT, data, timeout=READ_TIMEOUT_MS)
+            tx = self._usb_tx_buffer
+            memoryview(tx)[:] = data
+            return self._device.write(EP_OUT, tx, timeout=READ_TIMEOUT_MS)
         else:
             raise RuntimeError(f"Unknown backend: {self._backend}")
 
@@ -278,50 +317,92 @@ class USBConnection:
                     return bytes(data)
                 return None
             elif self._backend == "pyusb":
-                data = self._device.read(EP_IN, HID_REPORT_SIZE, timeout=timeout_ms)
-                return bytes(data)
+                rx = self._usb_rx_buffer
+                count = self._device.read(EP_IN, rx, timeout=timeout_ms)
+                return rx[:count].tobytes()
         except Exception as e:
             logger.debug("Read error: %s", e)
             return None
 
-    def read_message(self, timeout_ms: int = READ_TIMEOUT_MS) -> Frame | None:
-        """Read one complete protocol message, reassembling chunked reports.
+    def _read_assembled(self, timeout_ms: int) -> bytes | None:
+        """Read one message's bytes, preamble onward, unparsed.
 
         Responses larger than one 64-byte HID report (e.g. the 512-byte
         preset data) arrive split across multiple reports. Each report
         carries a 1-byte length prefix; the first report's message header
         (preamble + size) tells us how many total bytes to expect.
 
-        Args:
-            timeout_ms: Timeout for each individual report read.
-
         Returns:
-            The parsed Frame, or None on timeout, bad preamble, or
-            checksum failure.
+            The assembled message, or None on timeout or a bad header.
         """
         report = self.read(timeout_ms)
         if report is None:
             return None
 
-        chunk_size = report[0]
-        assembled = bytes(report[1 : 1 + chunk_size])
-
-        total = message_total_size(assembled)
+        chunk = report[1 : 1 + report[0]]
+        total = message_total_size(chunk)
         if total is None:
             return None
+        if len(chunk) >= total:
+            return chunk
 
-        while len(assembled) < total:
+        # Collect chunks and join once, rather than growing a bytes object
+        chunks = [chunk]
+        received = len(chunk)
+        while received < total:
             report = self.read(timeout_ms)
             if report is None:
                 logger.debug(
                     "Timed out mid-message: %d of %d bytes assembled",
-                    len(assembled), total,
+                    received, total,
                 )
                 return None
-            chunk_size = report[0]
-            assembled += bytes(report[1 : 1 + chunk_size])
+            chunk = report[1 : 1 + report[0]]
+            chunks.append(chunk)
+            received += len(chunk)
+
+        return b"".join(chunks)
+
+    def _parse(
+        self, message: bytes, expected: frozenset[int] | None = None
+    ) -> Frame | None:
+        """Parse an assembled message, reusing the last single-report parse.
+
+        Messages whose command is not in *expected* are rejected before
+        the checksum is computed.
+        """
+        if message == self._last_message:
+            frame = self._last_frame
+            if expected is None or frame.command in expected:
+                return frame
+            return None
+        frame = parse_message(message, expected)
+        if frame is not None and len(message) < HID_REPORT_SIZE:
+            self._last_message = message
+            self._last_frame = frame
+        return frame
+
+    def read_message(
+        self,
+        timeout_ms: int = READ_TIMEOUT_MS,
+        expected: frozenset[int] | None = None,
+    ) -> Frame | None:
+        """Read one complete protocol message, reassembling chunked reports.
+
+        Args:
+            timeout_ms: Timeout for each individual report read.
+            expected: Optional set of command IDs the caller wants; any
+                other message is dropped without checksumming it, so a
+                corrupt unrelated message reads the same as a valid one.
 
-        return parse_message(assembled)
+        Returns:
+            The parsed Frame, or None on timeout, bad preamble, checksum
+            failure, or an unexpected command.
+        """
+        message = self._read_assembled(timeout_ms)
+        if message is None:
+            return None
+        return self._parse(message, expected)
 
     def send_and_receive(
         self,
@@ -354,6 +435,12 @@ class USBConnection:
         the wire is often not the answer to what was just asked. This
         skips messages until the expected reply arrives.
 
+        Skipped messages are judged on their command byte alone and never
+        checksummed, so a corrupt unrelated message is skipped like any
+        other rather than ending the wait. A message carrying *command*
+        that fails its checksum still ends it: that is the reply, and it
+        was garbled.
+
         Args:
             data: A 64-byte HID report to send.
             command: The reply command ID to wait for.
@@ -361,20 +448,28 @@ class USBConnection:
             max_skip: Give up after this many unrelated messages.
 
         Returns:
-            The matching Frame, or None on timeout or if too many
-            unrelated messages arrived first.
+            The matching Frame, or None on timeout, a corrupt reply, or
+            if too many unrelated messages arrived first.
         """
         self.write(data)
 
+        # Compare plain ints in the loop, not an IntEnum per message.
+        # Unrelated messages are dropped on their command byte alone,
+        # without checksumming them.
+        command = int(command)
+        expected = frozenset((command,))
         for _ in range(max_skip + 1):
-            frame = self.read_message(timeout_ms)
-            if frame is None:
+            message = self._read_assembled(timeout_ms)
+            if message is None:
                 return None
-            if frame.command == command:
+            frame = self._parse(message, expected)
+            if frame is not None:
                 return frame
+            if message[4] == command:
+                return None  # the reply itself failed its checksum
             logger.debug(
                 "Skipping unsolicited 0x%02X while awaiting 0x%02X",
-                frame.command, command,
+                message[4], command,
             )
         logger.warning("Gave up waiting for 0x%02X", command)
         return None
@@ -399,7 +494,10 @@ class USBConnection:
         hardware: notifications left over from earlier requests sit in
         the HID buffer ahead of the stream, and counting them as records
         truncates the collection (observed live: a 200-record dump came
-        back 188 because 12 stale messages were counted).
+        back 188 because 12 stale messages were counted). Skipped messages
+        are not checksummed, so a corrupt one is skipped too; a message
+        with *command* that fails its checksum ends the collection, as a
+        timeout does.
 
         Args:
             data: A 64-byte HID report to send.
@@ -415,27 +513,53 @@ class USBConnection:
         """
         self.write(data)
 
+        expected = None
+        if command is not None:
+            command = int(command)
+            expected = frozenset((command,))
         frames: list[Frame] = []
         skipped = 0
         while len(frames) < count:
-            frame = self.read_message(timeout_ms)
-            if frame is None:
+            message = self._read_assembled(timeout_ms)
+            frame = None if message is None else self._parse(message, expected)
+            if frame is not None:
+                frames.append(frame)
+                continue
+            if message is None or expected is None or message[4] in expected:
+                # Timed out, or a wanted message failed its checksum
                 logger.debug(
                     "Stream ended after %d of %d messages", len(frames), count
                 )
                 break
-            if command is not None and frame.command != command:
-                skipped += 1
-                if skipped > max_skip:
-                    logger.warning(
-                        "Gave up collecting 0x%02X after %d unrelated "
-                        "messages", command, skipped,
-                    )
-                    break
-                continue
-            frames.append(frame)
+            # Unrelated messages are dropped without checksumming them
+            skipped += 1
+            if skipped > max_skip:
+                logger.warning(
+                    "Gave up collecting 0x%02X after %d unrelated "
+                    "messages", command, skipped,
+                )
+                break
         return frames
 
+    def send_chunked(
+        self,
+        frames: list[bytes],
+        inter_frame_delay: float = 0.01,
+    ) -> None:
+        """Send multiple HID reports (chunked message) without reading.
+
+        For writes whose reply the caller collects separately, or not at
+        all, so no response is read or parsed here.
+
+        Args:
+            frames: List of 64-byte HID reports.
+            inter_frame_delay: Delay in seconds between frames.
+        """
+        for i, frame in enumerate(frames):
+            if i:
+                time.sleep(inter_frame_delay)
+            self.write(frame)
+
     def send_chunked_and_receive(
         self,
         frames: list[bytes],
@@ -452,9 +576,5 @@ class USBConnection:
         Returns:
             Parsed Frame, or None if no valid response.
         """
-        for i, frame in enumerate(frames):
-            self.write(frame)
-            if i < len(frames) - 1:
-                time.sleep(inter_frame_delay)
-
+        self.send_chunked(frames, inter_frame_delay)
         return self.read_message(timeout_ms)
@@ -1,3 +1,3 @@
 """Utility functions."""
 
-from .crc import crc16
+from .crc import crc16, crc16_update
@@ -1,9 +1,17 @@
-"""CRC-16 calculation using Mooer's 256-entry lookup table.
+"""CRC-16 calculation, delegating to :func:`binascii.crc_hqx`.
 
 The checksum covers the command byte + payload, and the final value
 is bitwise-inverted (~crc & 0xFFFF).
+
+Mooer's table is the standard CRC-16/CCITT table (polynomial 0x1021,
+MSB-first), which is exactly what the standard library's C
+implementation :func:`binascii.crc_hqx` computes. :func:`crc16` uses
+that; :func:`crc16_table` keeps the table-driven loop as the readable
+reference.
 """
 
+import binascii
+
 # fmt: off
 CRC_TABLE: list[int] = [
     0x0000, 0x1021, 0x2042, 0x3063, 0x4084, 0x50A5, 0x60C6, 0x70E7,
@@ -43,11 +51,28 @@ CRC_TABLE: list[int] = [
 
 
 def crc16(data: bytes) -> int:
-    """Compute CRC-16 over *data* using Mooer's lookup table.
+    """Compute CRC-16 over *data* with :func:`binascii.crc_hqx`.
 
     Returns the bitwise-inverted CRC (``~crc & 0xFFFF``), which is what
     the device expects as the 2-byte checksum appended to each frame.
+    *data* may be any bytes-like object, including a ``memoryview``.
+    """
+    return ~binascii.crc_hqx(data, 0) & 0xFFFF
+
+
+def crc16_update(state: int, data: bytes) -> int:
+    """Fold *data* into a running, not-yet-inverted CRC *state*.
+
+    Start from ``0`` and invert once at the end, so that
+    ``~crc16_update(crc16_update(0, a), b) & 0xFFFF == crc16(a + b)``.
+    This lets a checksum be taken over data that arrives in pieces
+    without joining it first.
     """
+    return binascii.crc_hqx(data, state)
+
+
+def crc16_table(data: bytes) -> int:
+    """Pure-Python equivalent of :func:`crc16`, walking ``CRC_TABLE``."""
     crc = 0x0000
     for byte in data:
         crc = CRC_TABLE[(crc >> 8) ^ byte] ^ (crc << 8)
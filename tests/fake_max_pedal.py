@@ -5,6 +5,9 @@ the legacy tools still exercise it. This one implements only what the two
 USB captures actually prove, so tests written against it fail if the code
 drifts from observed device behaviour.
 
+``ScriptedHidDevice`` and ``ScriptedUsbDevice`` are protocol-free stand-ins
+for transport tests that script the exact reports the host reads.
+
 Implemented exchanges (all confirmed):
 
 ===================  ==========================================
@@ -270,16 +273,72 @@ class FakeMaxPedal:
         # show a reply, so tests must not depend on one.
 
 
-def make_max_connection(
-    pedal: FakeMaxPedal | None = None,
-) -> tuple[USBConnection, FakeMaxPedal]:
-    """Return a real USBConnection wired to a FakeMaxPedal."""
-    pedal = pedal or FakeMaxPedal()
+class ScriptedHidDevice:
+    """A bare ``hid.device`` that replays canned reports.
+
+    For transport tests that need exact control over what the host reads,
+    where ``FakeMaxPedal`` would answer by protocol. Writes are recorded
+    without their report-ID byte; an empty queue reads as a timeout.
+    """
+
+    def __init__(self, reports: list[bytes] = ()) -> None:
+        self.reports: deque[bytes] = deque(reports)
+        self.sent: list[bytes] = []
+        self.reads = 0
+
+    def write(self, data: bytes) -> int:
+        self.sent.append(bytes(data[1:]))
+        return len(data)
+
+    def read(self, size: int, timeout_ms: int = 0) -> bytes:
+        self.reads += 1
+        return self.reports.popleft() if self.reports else b""
+
+    def close(self) -> None:
+        pass
+
+
+class ScriptedUsbDevice:
+    """A bare pyusb device that replays canned reports.
+
+    Mimics the endpoint API ``USBConnection`` uses with pyusb. Each write
+    is recorded as ``(endpoint, buffer, bytes at write time)`` and each
+    read's ``(endpoint, buffer)`` is kept, so tests can check buffer reuse.
+    """
+
+    def __init__(self, reports: list[bytes] = ()) -> None:
+        self.reports: deque[bytes] = deque(reports)
+        self.writes: list[tuple[int, object, bytes]] = []
+        self.read_buffers: list[tuple[int, object]] = []
+
+    def write(self, endpoint: int, data, timeout: int | None = None) -> int:
+        self.writes.append((endpoint, data, bytes(data)))
+        return len(data)
+
+    def read(self, endpoint: int, buffer, timeout: int | None = None) -> int:
+        self.read_buffers.append((endpoint, buffer))
+        if not self.reports:
+            raise TimeoutError("no report queued")
+        report = self.reports.popleft()
+        buffer[: len(report)] = type(buffer)("B", report)
+        return len(report)
+
+
+def make_connection(device, backend: str = "hidapi") -> USBConnection:
+    """Return a real USBConnection already open on *device*."""
     conn = USBConnection()
-    conn._device = pedal
-    conn._backend = "hidapi"
+    conn._device = device
+    conn._backend = backend
     conn._connected = True
     # reconnect() enumerates real HID devices; a test must never be able
     # to reach actual hardware (it did once, and read a live pedal).
     conn.reconnect = lambda timeout_s=20.0: True
-    return conn, pedal
+    return conn
+
+
+def make_max_connection(
+    pedal: FakeMaxPedal | None = None,
+) -> tuple[USBConnection, FakeMaxPedal]:
+    """Return a real USBConnection wired to a FakeMaxPedal."""
+    pedal = pedal or FakeMaxPedal()
+    return make_connection(pedal), pedal
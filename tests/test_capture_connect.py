@@ -13,6 +13,8 @@ pushes when it is operated by hand.
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 import pytest
 
 from mooer_ge150_mcp.protocol.commands import (
@@ -26,7 +28,9 @@ from mooer_ge150_mcp.protocol.commands import (
     build_read_active_preset,
     build_read_ir_list,
     build_save_preset,
+    build_select_preset_slot,
     decode_preset_record,
+    decode_record_name,
     encode_preset_record,
     response_command,
 )
@@ -36,6 +40,19 @@ from mooer_ge150_mcp.protocol.framing import (
     parse_frame,
 )
 
+from mooer_ge150_mcp.transport.usb_connection import (
+    EP_IN,
+    EP_OUT,
+    HID_INTERFACE,
+)
+
+from .fake_max_pedal import (
+    ScriptedHidDevice,
+    ScriptedUsbDevice,
+    make_connection,
+    make_max_connection,
+)
+
 # (command, payload hex) -- verbatim messages, one per distinct command.
 MESSAGES: list[tuple[int, str]] = [
     # --- connect sequence, host -> device -------------------------------
@@ -150,6 +167,12 @@ class TestPresetRecord:
         assert record.slot == 1
         assert record.name == "65 Deluxe"
 
+    def test_name_reads_without_a_full_decode(self):
+        payload = bytes.fromhex(PRESET_RECORD_HEX)
+        assert decode_record_name(payload) == "65 Deluxe"
+        with pytest.raises(ValueError):
+            decode_record_name(payload[:-1])
+
     def test_decode_carries_all_nine_modules(self):
         record = decode_preset_record(bytes.fromhex(PRESET_RECORD_HEX))
         assert list(record.modules) == MODULE_CHAIN
@@ -230,3 +253,124 @@ class TestPedalOriginatedNotifications:
         from mooer_ge150_mcp.protocol.commands import encode_module_block
 
         assert encode_module_block(block) == payload
+
+
+class TestHidapiConnection:
+    """USBConnection over hidapi, against a scripted device."""
+
+    def test_writes_reuse_the_output_buffer(self):
+        """Every hidapi write goes out as report ID 0x00 + the report,
+        from one reused buffer; the fake pedal rejects anything else."""
+        conn, pedal = make_max_connection()
+        buffer = conn._tx_buffer
+        conn.write(build_hello())
+        conn.write(build_select_preset_slot(5))
+        assert conn._tx_buffer is buffer
+        assert pedal.active_slot == 5
+
+    def test_repeated_report_reuses_its_parse(self):
+        """An identical single-report message hands back the same Frame."""
+        notification = build_select_preset_slot(7)
+        other = build_select_preset_slot(8)
+        conn = make_connection(
+            ScriptedHidDevice([notification, notification, other])
+        )
+
+        first = conn.read_message()
+        assert conn.read_message() is first
+        third = conn.read_message()
+        assert third is not first
+        assert (first.payload[0], third.payload[0]) == (7, 8)
+
+    def test_send_chunked_only_writes(self):
+        """A chunked write sends every report in order and reads nothing."""
+        reports = build_chunked_frames(0xC3, bytes(range(245)))
+        device = ScriptedHidDevice()
+        conn = make_connection(device)
+        conn.send_chunked(reports, inter_frame_delay=0)
+        assert device.sent == reports
+        assert device.reads == 0
+
+    def test_unrelated_messages_are_dropped_unchecked(self):
+        """An unrelated message is skipped on its command byte alone, so
+        even a corrupt one does not end the wait for the reply."""
+        corrupt = bytearray(build_select_preset_slot(3))
+        corrupt[7] ^= 0xFF  # break its checksum
+        reply = build_hello()
+        command = parse_frame(reply).command
+
+        conn = make_connection(ScriptedHidDevice([bytes(corrupt), reply]))
+        assert conn.send_and_expect(build_hello(), command) == parse_frame(reply)
+
+        conn = make_connection(
+            ScriptedHidDevice([bytes(corrupt), reply, reply])
+        )
+        frames = conn.send_and_collect(build_hello(), 2, command=command)
+        assert frames == [parse_frame(reply)] * 2
+
+    def test_a_corrupt_reply_ends_the_wait(self):
+        """A reply carrying the awaited command but failing its checksum
+        returns at once, rather than skipping on to later messages."""
+        reply = build_hello()
+        corrupt = bytearray(reply)
+        corrupt[7] ^= 0xFF
+        command = parse_frame(reply).command
+
+        device = ScriptedHidDevice([bytes(corrupt), reply])
+        conn = make_connection(device)
+        assert conn.send_and_expect(build_hello(), command) is None
+        assert list(device.reports) == [reply]
+
+        device = ScriptedHidDevice([reply, bytes(corrupt), reply])
+        conn = make_connection(device)
+        frames = conn.send_and_collect(build_hello(), 3, command=command)
+        assert frames == [parse_frame(reply)]
+        assert list(device.reports) == [reply]
+
+
+class TestPyusbConnection:
+    """USBConnection over pyusb, against a scripted device."""
+
+    def test_writes_reuse_one_array(self):
+        """pyusb gets the same array('B') every time, refilled with the
+        report."""
+        device = ScriptedUsbDevice()
+        conn = make_connection(device, backend="pyusb")
+        conn.write(build_hello())
+        conn.write(build_select_preset_slot(5))
+
+        (ep1, buf1, sent1), (ep2, buf2, sent2) = device.writes
+        assert ep1 == ep2 == EP_OUT
+        assert buf1 is buf2
+        assert sent1 == build_hello()
+        assert sent2 == build_select_preset_slot(5)
+
+    def test_reads_fill_one_array(self):
+        """pyusb reads land in the same preallocated array every time."""
+        reports = [build_hello(), build_select_preset_slot(5)]
+        device = ScriptedUsbDevice(reports)
+        conn = make_connection(device, backend="pyusb")
+        assert conn.read() == reports[0]
+        assert conn.read() == reports[1]
+
+        (ep1, first), (ep2, second) = device.read_buffers
+        assert ep1 == ep2 == EP_IN
+        assert first is second
+
+    def test_close_uses_the_module_from_open(self):
+        """close() releases through the usb.util captured at open time."""
+        calls = []
+        device = ScriptedUsbDevice()
+        conn = make_connection(device, backend="pyusb")
+        conn._usb_util = SimpleNamespace(
+            release_interface=lambda dev, intf: calls.append(
+                ("release", dev, intf)
+            ),
+            dispose_resources=lambda dev: calls.append(("dispose", dev)),
+        )
+        conn.close()
+        assert calls == [
+            ("release", device, HID_INTERFACE),
+            ("dispose", device),
+        ]
+        assert not conn.connected
@@ -12,6 +12,8 @@ import pytest
 
 from mooer_ge150_mcp.protocol.commands import (
     Command,
+    build_command,
+    build_read_ctrl_config,
     build_save_preset,
     build_select_preset_slot,
     build_set_cab_sim_thru,
@@ -21,7 +23,11 @@ from mooer_ge150_mcp.protocol.commands import (
     db_to_level,
     level_to_db,
 )
-from mooer_ge150_mcp.protocol.framing import parse_frame, HID_REPORT_SIZE
+from mooer_ge150_mcp.protocol.framing import (
+    build_frame,
+    parse_frame,
+    HID_REPORT_SIZE,
+)
 
 
 def test_command_enum_values():
@@ -62,6 +68,14 @@ def test_build_select_preset_slot_is_one_based():
         build_select_preset_slot(201)
 
 
+def test_build_select_preset_slot_table_matches_builder():
+    """The precomputed select frames are exactly what build_command makes."""
+    for slot in (1, 98, 200):
+        assert build_select_preset_slot(slot) == build_command(
+            Command.SELECT_PRESET, bytes([slot])
+        )
+
+
 def test_build_save_preset_carries_slot_and_padded_name():
     frame = parse_frame(build_save_preset(200, "Dual Lead"))
     assert frame is not None
@@ -90,6 +104,24 @@ def test_settings_builders_produce_valid_frames():
         assert parse_frame(report) is not None
 
 
+def test_precomputed_settings_frames_carry_their_values():
+    assert parse_frame(build_set_cab_sim_thru(False, True)).payload == (
+        b"\x00\x00\x01\x00"
+    )
+    assert parse_frame(build_set_spillover(False)).payload == b"\x00\x00"
+    assert parse_frame(build_read_ctrl_config(199)).payload == b"\xc7"
+    with pytest.raises(ValueError):
+        build_read_ctrl_config(200)
+
+
 def test_ctrl_config_needs_exactly_nine_flags():
     with pytest.raises(ValueError):
         build_write_ctrl_config(0, [True] * 8)
+
+
+def test_build_command_memoizes_repeated_frames():
+    first = build_command(Command.POLL, b"\x01\x00")
+    assert first == build_frame(Command.POLL, b"\x01\x00")
+    assert build_command(Command.POLL, b"\x01\x00") is first
+    # Mutable payloads bypass the cache but build the same report
+    assert build_command(Command.POLL, bytearray(b"\x01\x00")) == first
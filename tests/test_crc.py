@@ -1,6 +1,8 @@
 """Tests for CRC-16 calculation."""
 
-from mooer_ge150_mcp.utils.crc import crc16
+import random
+
+from mooer_ge150_mcp.utils.crc import crc16, crc16_table
 
 
 def test_crc16_empty():
@@ -39,3 +41,15 @@ def test_crc16_deterministic():
 def test_crc16_different_inputs():
     """Different inputs should produce different CRCs."""
     assert crc16(b"\x01") != crc16(b"\x02")
+
+
+def test_crc16_matches_mooer_table():
+    """The C-backed crc16 agrees with the table-driven reference."""
+    rng = random.Random(0x1021)
+    samples = [b"", b"\x00", bytes(range(256))] + [
+        bytes(rng.randrange(256) for _ in range(rng.randrange(1, 600)))
+        for _ in range(50)
+    ]
+    for data in samples:
+        assert crc16(data) == crc16_table(data)
+    assert crc16(memoryview(b"\xa6\x02")) == 0x6865
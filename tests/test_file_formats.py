@@ -3,6 +3,9 @@
 import tempfile
 from pathlib import Path
 
+import pytest
+
+from mooer_ge150_mcp.models.bank import PresetBank
 from mooer_ge150_mcp.models.preset import Preset
 from mooer_ge150_mcp.models.effects import AmpModule, ReverbModule
 from mooer_ge150_mcp.models.file_formats import (
@@ -11,6 +14,7 @@ from mooer_ge150_mcp.models.file_formats import (
     export_mbf,
     import_mbf,
     parse_gnr_header,
+    MBF_FILE_SIZE,
     MO_FILE_SIZE,
     MO_PRESET_OFFSET,
     GNR_MAGIC,
@@ -99,3 +103,76 @@ def test_gnr_too_small():
         assert False, "Should have raised ValueError"
     except ValueError:
         pass
+
+
+def test_preset_bank_from_mbf():
+    """A bank loaded from .mbf matches import_mbf slot for slot."""
+    presets = [
+        Preset(name=f"Bank {i}", amp=AmpModule(enabled=1, type=i, bass=10 + i))
+        for i in range(4)
+    ]
+    with tempfile.NamedTemporaryFile(suffix=".mbf", delete=False) as f:
+        path = export_mbf(presets, f.name)
+    bank = PresetBank.from_mbf(path)
+    restored = import_mbf(path)
+    Path(path).unlink()
+
+    assert len(bank) == len(restored)
+    for i, preset in enumerate(restored):
+        assert bank.record(i) == preset.to_bytes()
+    assert bank.name(2) == "Bank 2"
+    assert list(bank.param("amp", "bass")[:4]) == [10, 11, 12, 13]
+
+
+def test_preset_bank_param_view_writes_through():
+    """Editing a parameter view changes the materialized preset."""
+    bank = PresetBank.from_presets([Preset(name="A"), Preset(name="B")])
+    bank.param("reverb", "decay")[1] = 42
+    assert bank.to_preset(1).reverb.decay == 42
+    assert bank.to_preset(0).reverb.decay == 0
+
+
+
+def test_preset_bank_rejects_out_of_range_slots():
+    """Slot lookups check the bank's bounds instead of slicing past them."""
+    bank = PresetBank.from_presets([Preset(name="A"), Preset(name="B")])
+    for index in (-1, 2):
+        with pytest.raises(IndexError):
+            bank.name(index)
+        with pytest.raises(IndexError):
+            bank.record(index)
+
+def test_mbf_export_reuses_scratch_without_leaking():
+    """A second export through the shared scratch buffer is unaffected."""
+    busy = [Preset(name=f"Busy {i}", tail=b"\xff" * 353) for i in range(3)]
+    quiet = [Preset(name="Quiet")]
+    with tempfile.TemporaryDirectory() as tmp:
+        export_mbf(busy, Path(tmp) / "busy.mbf")
+        path = export_mbf(quiet, Path(tmp) / "quiet.mbf")
+        restored = import_mbf(path)
+    assert restored[0].to_bytes() == quiet[0].to_bytes()
+    assert restored[1].name == ""
+
+
+def test_mbf_export_writes_a_full_file_with_a_clean_header():
+    with tempfile.TemporaryDirectory() as tmp:
+        export_mbf([], Path(tmp) / "long.mbf", model_name="X" * 32)
+        path = export_mbf([], Path(tmp) / "short.mbf", model_name="GE")
+        data = path.read_bytes()
+    assert len(data) == MBF_FILE_SIZE
+    assert data[:12] == b"MOOER\x00\x00\x00GE\x00\x00"
+
+
+def test_failed_mbf_export_leaves_an_existing_file_intact():
+    good = [Preset(name=f"Good {i}") for i in range(3)]
+    bad = [Preset(name="Fine"), Preset(amp=AmpModule(bass=256))]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = export_mbf(good, Path(tmp) / "backup.mbf")
+        before = path.read_bytes()
+        with pytest.raises(ValueError):
+            export_mbf(bad, path)
+        assert path.read_bytes() == before
+        assert [p.name for p in import_mbf(path)[:3]] == [
+            "Good 0", "Good 1", "Good 2"
+        ]
+        assert list(Path(tmp).iterdir()) == [path]
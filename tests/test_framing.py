@@ -1,11 +1,16 @@
 """Tests for message frame building and parsing."""
 
+import pytest
+
 from mooer_ge150_mcp.protocol.framing import (
     build_frame,
+    build_frame_factory,
     parse_frame,
     build_chunked_frames,
+    parse_chunked_frames,
     Frame,
     HID_REPORT_SIZE,
+    MAX_PAYLOAD_PER_FRAME,
     PREAMBLE,
 )
 from mooer_ge150_mcp.utils.crc import crc16
@@ -127,3 +132,66 @@ def test_frame_repr():
     f = Frame(command=0xA6, payload=b"\x02")
     r = repr(f)
     assert "0xA6" in r
+
+
+def test_frame_is_immutable():
+    """Parsed frames are frozen, so they can be shared and cached."""
+    f = Frame(command=0xA6, payload=b"\x02")
+    with pytest.raises(AttributeError):
+        f.command = 0x00
+    assert hash(f) == hash(Frame(command=0xA6, payload=b"\x02"))
+
+
+def test_build_frame_factory_matches_build_frame():
+    """A specialised builder produces exactly what build_frame does."""
+    build = build_frame_factory(0x84, 24)
+    for payload in (bytes(24), bytes(range(24)), b"\xff" * 24):
+        assert build(payload) == build_frame(0x84, payload)
+    with pytest.raises(ValueError):
+        build(b"\x00" * 23)
+    for size in (0, 1, MAX_PAYLOAD_PER_FRAME):
+        payload = bytes(range(size))
+        assert build_frame_factory(0x97, size)(payload) == build_frame(
+            0x97, payload
+        )
+
+
+def test_parse_chunked_frames_incremental_crc():
+    """Chunk-by-chunk checksumming accepts good messages of any length
+    and rejects a corrupted byte in any report."""
+    for size in (0, 1, 56, 57, 58, 60, 120, 245, 600):
+        payload = bytes((i * 7) & 0xFF for i in range(size))
+        reports = build_chunked_frames(0x20, payload)
+        frame = parse_chunked_frames(reports)
+        assert frame == Frame(command=0x20, payload=payload)
+
+        for i in range(len(reports)):
+            bad = [bytearray(r) for r in reports]
+            bad[i][bad[i][0]] ^= 0x01  # last meaningful byte of report i
+            assert parse_chunked_frames([bytes(r) for r in bad]) is None
+
+
+def test_parsed_payload_is_materialized_lazily():
+    """A parsed frame keeps a view until the payload is first read."""
+    frame = parse_frame(build_frame(0x20, b"\x01\x02\x03"))
+    assert frame.command == 0x20
+    assert type(frame._payload) is memoryview
+    assert frame.payload == b"\x01\x02\x03"
+    assert type(frame._payload) is bytes
+    assert frame.payload is frame.payload
+    # A mutable source buffer is copied up front, so reusing it is safe
+    buf = bytearray(build_frame(0x20, b"\x09"))
+    frame = parse_frame(buf)
+    buf[:] = bytes(len(buf))
+    assert frame.payload == b"\x09"
+
+
+def test_parse_filters_unexpected_commands():
+    """Frames outside the expected set are rejected; others parse as usual."""
+    report = build_frame(0x20, b"\x01")
+    assert parse_frame(report, frozenset({0x20})) == Frame(0x20, b"\x01")
+    assert parse_frame(report, frozenset({0x21})) is None
+
+    reports = build_chunked_frames(0x20, bytes(100))
+    assert parse_chunked_frames(reports, frozenset({0x20})) is not None
+    assert parse_chunked_frames(reports, frozenset({0xA6})) is None
@@ -90,6 +90,29 @@ class TestSetGetRoundTrip:
         assert "error" in result
         assert "effect_type" in result["error"]
 
+    def test_fully_specified_preset_skips_the_dump(self, wired):
+        server, _, pedal = wired
+        full = {
+            name: {"enabled": True, "effect_type": 1, "params": [7]}
+            for name in ("fx", "ds", "amp", "cab", "ns", "eq", "mod",
+                         "delay", "reverb")
+        }
+        with patch.object(server, "_fetch_all_records") as fetch:
+            result = server.set_preset(4, name="Scratch", effects=full)
+            server.set_preset(5, name="Blank", merge=False)
+        fetch.assert_not_called()
+        assert result["stored"] is True
+        assert pedal.records[5].name == "Scratch"
+        assert pedal.records[5].modules[Command.AMP].params[0] == 7
+
+    def test_partial_spec_still_merges(self, wired):
+        server, _, _ = wired
+        with patch.object(
+            server, "_fetch_all_records", wraps=server._fetch_all_records
+        ) as fetch:
+            server.set_preset(4, name="Half", effects={"amp": {"params": [1]}})
+        fetch.assert_called_once()
+
 
 class TestCopyAndSwap:
     def test_copy_is_select_then_save_as(self, wired):
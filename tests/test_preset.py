@@ -1,5 +1,7 @@
 """Tests for preset data model serialization/deserialization."""
 
+import pytest
+
 from mooer_ge150_mcp.models.preset import Preset, PRESET_SIZE
 from mooer_ge150_mcp.models.effects import (
     FXModule,
@@ -86,7 +88,45 @@ def test_eq_bands():
     preset = Preset(eq=EQModule(enabled=1, type=0, bands=bands))
     data = preset.to_bytes()
     restored = Preset.from_bytes(data)
-    assert restored.eq.bands == bands
+    assert list(restored.eq.bands) == bands
+    assert restored.eq.to_dict()["bands"] == bands
+
+
+def test_eq_set_band():
+    """set_band edits one band without touching the others."""
+    eq = EQModule(bands=bytes([1, 2, 3, 4, 5, 6]))
+    eq.set_band(2, 99)
+    assert list(EQModule.from_bytes(eq.to_bytes()).bands) == [1, 2, 99, 4, 5, 6]
+
+
+def test_out_of_range_module_fields_raise_value_error():
+    with pytest.raises(ValueError):
+        AmpModule(bass=256).to_bytes()
+    with pytest.raises(ValueError):
+        AmpModule(bass=-1).pack_into(bytearray(AmpModule.SIZE), 0)
+
+
+def test_out_of_range_preset_fields_raise_value_error():
+    preset = Preset(amp=AmpModule(bass=256))
+    with pytest.raises(ValueError):
+        preset.to_bytes()
+    with pytest.raises(ValueError):
+        preset.pack_into(bytearray(PRESET_SIZE), 0)
+
+
+def test_delay_time_is_masked_to_16_bits():
+    data = DelayModule(time_ms=0x11170).to_bytes()
+    assert DelayModule.from_bytes(data).time_ms == 0x1170
+
+
+def test_eq_bands_assigned_as_a_list():
+    """Bands reassigned after construction still pack."""
+    eq = EQModule()
+    eq.bands = [6, 5, 4, 3, 2, 1]
+    eq.bands_extra = [7] * 6
+    restored = EQModule.from_bytes(eq.to_bytes())
+    assert list(restored.bands) == [6, 5, 4, 3, 2, 1]
+    assert list(restored.bands_extra) == [7] * 6
 
 
 def test_get_module():
@@ -126,3 +166,75 @@ def test_all_modules_size():
     assert len(ModulationModule().to_bytes()) == 15
     assert len(DelayModule().to_bytes()) == 17
     assert len(ReverbModule().to_bytes()) == 13
+
+
+def test_all_modules_bytes_roundtrip_exact():
+    """Every module should reproduce its input bytes, reserved tail included."""
+    for cls in (FXModule, DistortionModule, AmpModule, CabModule,
+                NoiseGateModule, EQModule, ModulationModule, DelayModule,
+                ReverbModule):
+        raw = bytes(range(1, cls.SIZE + 1))
+        assert cls.from_bytes(raw).to_bytes() == raw, cls.__name__
+
+
+def test_preset_from_memoryview():
+    """Parsing from a view into a larger buffer matches parsing bytes."""
+    preset = Preset(name="View", amp=AmpModule(enabled=1, type=7, bass=33))
+    data = b"\xff" * 8 + preset.to_bytes()
+    restored = Preset.from_bytes(memoryview(data)[8:])
+    assert restored.to_bytes() == preset.to_bytes()
+
+
+def test_to_bytes_sees_in_place_module_edits():
+    """Serializing again after editing a module reflects the edit."""
+    preset = Preset(name="Edit")
+    preset.to_bytes()
+
+    preset.amp.bass = 77
+    preset.effect_order[0] = 4
+    restored = Preset.from_bytes(preset.to_bytes())
+    assert restored.amp.bass == 77
+    assert restored.effect_order[0] == 4
+
+    buf = bytearray(PRESET_SIZE)
+    preset.delay.level = 12
+    preset.pack_into(buf, 0)
+    assert Preset.from_bytes(buf).delay.level == 12
+
+
+def test_rename_shorter_clears_old_name():
+    """Renaming to a shorter name must not leave stale trailing bytes."""
+    preset = Preset(name="LongPresetName")
+    preset.to_bytes()
+    preset.name = "Hi"
+    assert Preset.from_bytes(preset.to_bytes()).name == "Hi"
+
+
+def test_pack_into_overwrites_dirty_buffer():
+    """pack_into writes every byte, so stale buffer contents never leak."""
+    preset = Preset(name="Dirty", delay=DelayModule(enabled=1, time_ms=700))
+    buf = bytearray(b"\xaa" * (PRESET_SIZE + 4))
+    preset.pack_into(buf, 2)
+    assert bytes(buf[2 : 2 + PRESET_SIZE]) == preset.to_bytes()
+    assert buf[:2] == b"\xaa\xaa" and buf[-2:] == b"\xaa\xaa"
+
+
+def test_module_to_dict_covers_every_field():
+    """Hand-written to_dict must list every field except the reserved tail."""
+    from dataclasses import fields
+
+    for cls in (FXModule, DistortionModule, AmpModule, CabModule,
+                NoiseGateModule, EQModule, ModulationModule, DelayModule,
+                ReverbModule):
+        expected = [f.name for f in fields(cls) if f.name != "reserved"]
+        assert list(cls().to_dict()) == expected, cls.__name__
+
+
+def test_param_offsets_are_computed_once_per_class():
+    offsets = DelayModule.param_offsets()
+    assert offsets is DelayModule.param_offsets()
+    assert offsets is not ReverbModule.param_offsets()
+    # time_ms is two bytes wide, so the next field starts two later
+    assert offsets["subdivision"] - offsets["time_ms"] == 2
+    with pytest.raises(TypeError):
+        offsets["time_ms"] = 0
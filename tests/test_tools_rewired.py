@@ -23,6 +23,7 @@ def wired():
     server = _get_server_module()
     conn, pedal = make_max_connection()
     server._record_cache = {}
+    server._disk_records = None
     with patch.object(server, "_get_connection", return_value=conn):
         yield server, conn, pedal
 
@@ -38,7 +39,7 @@ def test_server_imports_and_registers_its_tools():
     import mooer_ge150_mcp.server as real_server
 
     tools = asyncio.run(real_server.mcp.list_tools())
-    assert len(tools) == 36
+    assert len(tools) == 40
     assert "list_ir_slots" in {t.name for t in tools}
 
 
@@ -195,6 +196,75 @@ class TestEffectEditing:
         assert "error" in server.set_effect_param("amp", 0, 70000)
         assert pedal.written_blocks == []
 
+    def test_set_params_writes_one_block_for_many_values(self, wired):
+        server, _, pedal = wired
+        before = pedal.records[pedal.active_slot].modules[Command.AMP]
+
+        result = server.set_effect_params("amp", {0: 90, "2": 40})
+
+        assert len(pedal.written_blocks) == 1
+        _, written = pedal.written_blocks[0]
+        assert written.params[0] == 90
+        assert written.params[2] == 40
+        assert written.params[1] == before.params[1]
+        assert result["params"][:3] == written.params[:3]
+
+    def test_set_params_validates_before_writing(self, wired):
+        server, _, pedal = wired
+        assert "error" in server.set_effect_params("amp", {0: 1, 10: 1})
+        assert "error" in server.set_effect_params("amp", {0: 70000})
+        assert "error" in server.set_effect_params("amp", {})
+        assert pedal.written_blocks == []
+
+
+class TestSlotValidation:
+    @pytest.mark.parametrize("slot", [-1, 200])
+    def test_slot_tools_reject_out_of_range_slots(self, wired, slot):
+        server, _, pedal = wired
+        assert server.get_preset(slot) == {"error": "Slot must be 0-199"}
+        assert "error" in server.import_preset("unused.json", slot)
+        assert "error" in server.save_preset(slot=slot, name="X")
+        assert pedal.saves == []
+
+    def test_wrapped_tools_keep_their_signature(self):
+        import inspect
+
+        server = _get_server_module()
+        params = inspect.signature(server.import_preset).parameters
+        assert list(params) == ["input_path", "slot"]
+
+
+class TestBatchPresetTools:
+    def test_get_presets_reads_many_slots_from_one_dump(self, wired):
+        server, _, _ = wired
+        result = server.get_presets([5, 0, 5, 192])
+        assert [p["slot"] for p in result["presets"]] == [0, 5, 192]
+        assert result["presets"][2]["name"] == "Preset 193"
+
+    def test_get_presets_rejects_bad_slots(self, wired):
+        server, _, _ = wired
+        assert "error" in server.get_presets([0, 200])
+        assert "error" in server.get_presets([])
+
+    def test_set_presets_writes_each_slot(self, wired):
+        server, _, pedal = wired
+        result = server.set_presets({
+            3: {"name": "Lead"},
+            "4": {"effects": {"amp": {"effect_type": 9}}},
+        })
+        assert [p["slot"] for p in result["presets"]] == [3, 4]
+        assert pedal.records[4].name == "Lead"
+        assert pedal.records[5].modules[Command.AMP].effect_type == 9
+
+    def test_set_presets_checks_every_entry_before_writing(self, wired):
+        server, _, pedal = wired
+        result = server.set_presets({
+            3: {"name": "Fine"},
+            4: {"effects": {"chorus": {"effect_type": 1}}},
+        })
+        assert "error" in result
+        assert pedal.saves == []
+
 
 class TestDeviceInfo:
     """No identify exchange exists, so we report only what we can know."""
@@ -309,6 +379,125 @@ class TestWritePath:
         assert server._record_cache == {}
 
 
+class TestRecordDiskCache:
+    """The last dump is persisted so a restarted server can list names."""
+
+    @pytest.fixture
+    def cached(self, wired, tmp_path):
+        server, conn, pedal = wired
+        with patch.object(server, "_record_cache_file", tmp_path / "records.bin"):
+            yield server, conn, pedal
+
+    def test_restart_lists_names_from_the_persisted_dump(self, cached):
+        import json
+
+        server, _, _ = cached
+        server.list_presets(0, 0)
+        server._record_cache = {}  # a fresh process
+
+        with patch.object(server, "_get_connection", side_effect=RuntimeError):
+            presets = json.loads(server.resource_presets_list())["presets"]
+        assert len(presets) == 200
+        assert presets[0]["name"] == "Preset 1"
+
+    def test_writes_never_merge_from_the_persisted_dump(self, cached):
+        """Presets can change on the pedal; a merge re-reads the device."""
+        server, _, pedal = cached
+        server.list_presets(0, 0)
+        server._record_cache = {}
+        server.resource_presets_list()  # loads the disk copy for listing
+        pedal.records[1].name_raw = b"Edited".ljust(16, b"\x00")
+
+        assert server._fetch_all_records(refresh=False)[0].name == "Edited"
+
+    def test_corrupt_file_lists_nothing(self, cached, tmp_path):
+        import json
+
+        server, _, _ = cached
+        server.list_presets(0, 0)
+        server._record_cache = {}
+        path = tmp_path / "records.bin"
+        path.write_bytes(path.read_bytes()[:-1] + b"\x00")
+
+        assert json.loads(server.resource_presets_list()) == {"presets": []}
+
+    def test_cache_file_is_per_serial_number(self):
+        server = _get_server_module()
+        one = server._record_cache_path(0x34DB, 0x000F, "A1")
+        two = server._record_cache_path(0x34DB, 0x000F, "B2")
+        assert one != two
+        assert one.name == "records-34db-000f-A1.bin"
+        assert server._record_cache_path(0x34DB, 0x000F, "../").name == (
+            "records-34db-000f.bin"
+        )
+
+    def test_clear_cache_drops_memory_and_disk(self, cached, tmp_path):
+        server, _, _ = cached
+        server.list_presets(0, 0)
+        assert server.clear_cache() == {"cleared": True, "records": 200}
+        assert server._record_cache == {}
+        assert not (tmp_path / "records.bin").exists()
+
+    def test_disconnect_drops_cached_records_but_keeps_the_file(
+        self, cached, tmp_path
+    ):
+        server, conn, _ = cached
+        server.list_presets(0, 0)
+        with patch.object(server, "_connection", conn):
+            assert server.disconnect() == {"disconnected": True}
+            assert server._connection is None
+            assert server._record_cache == {}
+            assert server._record_cache_file is None
+        assert not conn.connected
+        assert (tmp_path / "records.bin").exists()
+
+    def test_saving_deletes_the_persisted_dump(self, cached, tmp_path):
+        server, _, _ = cached
+        server.list_presets(0, 0)
+        assert (tmp_path / "records.bin").exists()
+        server.save_preset(0, "New")
+        assert not (tmp_path / "records.bin").exists()
+
+
+class TestCatalogResources:
+    def test_catalog_bodies_match_the_catalogs(self):
+        import json
+
+        server = _get_server_module()
+        amps = json.loads(server.resource_amp_catalog())
+        assert amps["count"] == len(server.AMP_MODELS)
+        assert amps["amps"][0] == {"id": 0, "name": server.AMP_MODELS[0]}
+        effects = json.loads(server.resource_effects_catalog())["effects"]
+        assert set(effects) == set(server.EFFECT_CATALOG)
+        assert len(json.loads(server.resource_ir_slots())["slots"]) == 10
+
+
+class TestPresetsListResource:
+    def test_rendered_once_per_dump(self, wired):
+        import json
+
+        server, _, pedal = wired
+        server.list_presets(0, 0)
+        body = server.resource_presets_list()
+        assert len(json.loads(body)["presets"]) == 200
+        assert server.resource_presets_list() is body
+
+        pedal.records[1].name_raw = b"Fresh".ljust(16, b"\x00")
+        server.list_presets(0, 0)  # a new dump replaces the cache
+        assert json.loads(server.resource_presets_list())["presets"][0][
+            "name"
+        ] == "Fresh"
+
+    def test_invalidation_empties_the_list(self, wired):
+        import json
+
+        server, _, _ = wired
+        server.list_presets(0, 0)
+        server.resource_presets_list()
+        server.clear_cache()
+        assert json.loads(server.resource_presets_list()) == {"presets": []}
+
+
 class TestExpressionAssignment:
     def test_sends_the_observed_shape(self, wired):
         server, conn, _ = wired
@@ -413,6 +602,12 @@ class TestPutPreset:
         assert pedal.records[5].name == "Uploaded"
         assert pedal.records[5].modules[Command.AMP].effect_type == 7
 
+    def test_upload_progress_is_logged(self, wired, caplog):
+        server, _, _ = wired
+        with caplog.at_level("INFO", logger=server.logger.name):
+            server.put_preset(4, {"name": "Logged", "modules": {}})
+        assert "Uploaded 1 of 1 preset records (1 acknowledged)" in caplog.text
+
     def test_does_not_disturb_the_active_preset(self, wired):
         server, _, pedal = wired
         pedal.active_slot = 1